@@ -1,14 +1,56 @@
 # proof_bot/config.py
 import os
-import json
-import random
+
+import numpy as np
+import orjson
 from dataclasses import dataclass, field
+from functools import cached_property
 from dotenv import load_dotenv
 from typing import List, Dict, Any, Optional
 
 # Load environment variables from .env file at the project root
 load_dotenv()
 
+# Build-time compiled selector module (see scripts/compile_selectors.py);
+# absent in dev checkouts, in which case loaders fall back to the JSON files.
+try:
+    from ._compiled_selectors import SELECTORS as _COMPILED_SELECTORS
+except ImportError:
+    _COMPILED_SELECTORS = {}
+
+# NEW: Snapshot the env vars we care about once, right after load_dotenv().
+# os.getenv goes through os.environ on every call; reading them here turns
+# repeated lookups (re-instantiation in tests, reloads) into plain dict hits.
+_ENV_KEYS = (
+    'GITHUB_TOKEN', 'TELEGRAM_TOKEN', 'TELEGRAM_CHAT_ID',
+    'LINKEDIN_USERNAME', 'LINKEDIN_PASSWORD', 'TWITTER_API_KEY',
+    'TWILIO_SID', 'TWILIO_TOKEN', 'OPENAI_API_KEY', 'CH_API_KEY',
+)
+_ENV_CACHE = {k: os.environ.get(k, '') for k in _ENV_KEYS}
+
+# NEW: One pre-seeded Generator for all random picks over the JSON lists.
+# Set PROOF_BOT_SEED for reproducible location/SIC selection across runs.
+_RNG = np.random.default_rng(int(os.environ.get('PROOF_BOT_SEED', '0')) or None)
+
+# NEW: Module-level parse cache for the expanded locations/SICs JSON, keyed by
+# path with the file mtime recorded (stale-while-revalidate: serve the cached
+# parse while the mtime is unchanged, re-read only when the file changed).
+_JSON_CACHE: Dict[str, tuple] = {}  # path -> (mtime, parsed data)
+
+def _load_config_json(path: str) -> Dict[str, Any]:
+    """Load and cache the expanded locations/SICs JSON; re-parse only on mtime change."""
+    if not os.path.exists(path):
+        print(f"Warning: {path} not found. Using defaults.")
+        return {}
+    mtime = os.path.getmtime(path)
+    cached = _JSON_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'rb') as f:
+        data = orjson.loads(f.read())
+    _JSON_CACHE[path] = (mtime, data)
+    return data
+
 @dataclass
 class BotConfig:
     """Central configuration for the bot, loaded from environment variables."""
@@ -21,28 +63,32 @@ class BotConfig:
     # NEW: JSON config file for expanded locations and SIC codes
     config_json_path: str = "expanded_locations_and_sics.json"  # Path to the JSON file
 
-    # Loaded from JSON (populated in __post_init__)
-    locations: List[Dict[str, Any]] = field(default_factory=list)
-    business_types: List[Dict[str, Any]] = field(default_factory=list)
-
-    # API Keys (loaded from .env file)
-    github_token: str = os.getenv('GITHUB_TOKEN', '')
-    telegram_token: str = os.getenv('TELEGRAM_TOKEN', '')
-    telegram_chat_id: str = os.getenv('TELEGRAM_CHAT_ID', '')
-    linkedin_username: str = os.getenv('LINKEDIN_USERNAME', '')
-    linkedin_password: str = os.getenv('LINKEDIN_PASSWORD', '')
-    twitter_api_key: str = os.getenv('TWITTER_API_KEY', '')
-    twilio_account_sid: str = os.getenv('TWILIO_SID', '')
-    twilio_auth_token: str = os.getenv('TWILIO_TOKEN', '')
-    openai_api_key: str = os.getenv('OPENAI_API_KEY', '')
+    # API Keys (served from the module-level _ENV_CACHE snapshot)
+    github_token: str = field(default_factory=lambda k='GITHUB_TOKEN': _ENV_CACHE[k])
+    telegram_token: str = field(default_factory=lambda k='TELEGRAM_TOKEN': _ENV_CACHE[k])
+    telegram_chat_id: str = field(default_factory=lambda k='TELEGRAM_CHAT_ID': _ENV_CACHE[k])
+    linkedin_username: str = field(default_factory=lambda k='LINKEDIN_USERNAME': _ENV_CACHE[k])
+    linkedin_password: str = field(default_factory=lambda k='LINKEDIN_PASSWORD': _ENV_CACHE[k])
+    twitter_api_key: str = field(default_factory=lambda k='TWITTER_API_KEY': _ENV_CACHE[k])
+    twilio_account_sid: str = field(default_factory=lambda k='TWILIO_SID': _ENV_CACHE[k])
+    twilio_auth_token: str = field(default_factory=lambda k='TWILIO_TOKEN': _ENV_CACHE[k])
+    openai_api_key: str = field(default_factory=lambda k='OPENAI_API_KEY': _ENV_CACHE[k])
+    # Companies House REST API key; when set, CH data comes from the JSON API
+    # instead of browser automation
+    ch_api_key: str = field(default_factory=lambda k='CH_API_KEY': _ENV_CACHE[k])
 
     # Scraping settings
     respect_robots: bool = True
     screenshot_missing_data: bool = True
     verify_all_data: bool = True
     max_workers: int = 5
+    profile_concurrency: int = 6  # In-flight company profiles across the context pool
+    officer_concurrency: int = 4  # Parallel officer-detail pages per company
+    enrich_concurrency: int = 12  # In-flight lead enrichment tasks
     request_delay: float = 2.0  # Increased default for politeness
     selectors_file: str = "selectors.json"
+    # Playwright storage_state dump reused across runs (cookies incl. consent)
+    browser_state_file: str = "browser_state.json"
 
     # Outreach settings
     use_psychology: bool = True
@@ -65,102 +111,146 @@ class BotConfig:
     selected_location_index: Optional[int] = None  # Override for specific location
     selected_industry_index: Optional[int] = None  # Override for specific industry
 
-def __post_init__(self):
-    """Sets default lists... Also loads JSON and handles smart selections."""
-    # ✅ Initialize default SIC codes if empty
-    if not self.sic_codes:
-        self.sic_codes = [
-            "73110",  # Advertising agencies
-            "62012",  # Business and domestic software development
-            "62090",  # Other information technology service activities
-            "63110",  # Data processing, hosting and related activities
-            "63120",  # Web portals
-            "70229"   # Management consultancy activities other than financial management
-        ]
-    # The proxy_pool is fine as an empty list, so no changes needed for it here.
-
-    # Load the expanded JSON file if it exists
-    if os.path.exists(self.config_json_path):
-        with open(self.config_json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            self.locations = data.get('locations', [])
-            self.business_types = data.get('business_types', [])
-        
+    # NEW: Lazy views over the expanded JSON file. Nothing is read or parsed
+    # until a code path actually touches locations/business_types, and repeat
+    # instantiations share the module-level _JSON_CACHE parse.
+    @cached_property
+    def locations(self) -> List[Dict[str, Any]]:
+        return _load_config_json(self.config_json_path).get('locations', [])
+
+    @cached_property
+    def business_types(self) -> List[Dict[str, Any]]:
+        business_types = _load_config_json(self.config_json_path).get('business_types', [])
+        # Pack the 5-digit SIC codes into int32 arrays alongside the string
+        # lists (4 bytes vs ~54 bytes per code); dedup/union work on these and
+        # only converts back to zero-padded strings at the API boundary.
+        # Idempotent, so sharing the cached parse across instances is fine.
+        for bt in business_types:
+            if 'key_sic_codes_int' not in bt:
+                bt['key_sic_codes_int'] = np.array(
+                    [int(c) for c in bt['key_sic_codes']], dtype=np.int32
+                )
+        return business_types
+
+    def apply_smart_selection(self):
+        """Run the random/exhaustive location+SIC selection (called by ProofBot.run())."""
+        if not os.path.exists(self.config_json_path):
+            print(f"Warning: {self.config_json_path} not found. Using defaults.")
+            return
+
         print(f"Loaded {len(self.locations)} locations, {len(self.business_types)} business types.")  # Log findings
-        
+
         # NEW: Dynamic SIC cycling from business_types (varied for exhaustive/random_industry)
         if self.exhaustive_mode or self.random_industry:
             if self.business_types:
-                selected_types = random.sample(self.business_types, min(3, len(self.business_types)))  # Pick 3 random
-                self.sic_codes = []
-                for bt in selected_types:
-                    self.sic_codes.extend(bt['key_sic_codes'])
-                self.sic_codes = list(set(self.sic_codes))  # Dedup
+                k = min(3, len(self.business_types))
+                selected_types = [self.business_types[i] for i in
+                                  _RNG.choice(len(self.business_types), size=k, replace=False)]  # Pick 3 random
+                # Vectorized dedup over the packed int32 arrays; np.unique
+                # sorts, so the result is deterministic run-to-run
+                codes = np.unique(np.concatenate(
+                    [bt['key_sic_codes_int'] for bt in selected_types]
+                ))
+                self.sic_codes = [f"{c:05d}" for c in codes]
                 self.target_industry = ', '.join([bt['example_industry'] for bt in selected_types])
                 print(f"Selected varied SICs: {self.sic_codes} for industries: {self.target_industry}")  # Log
             else:
                 # Fallback: Cycle defaults
-                self.sic_codes = random.sample(self.sic_codes, min(4, len(self.sic_codes)))
+                k = min(4, len(self.sic_codes))
+                self.sic_codes = [self.sic_codes[i] for i in
+                                  _RNG.choice(len(self.sic_codes), size=k, replace=False)]
                 print(f"Fallback: Cycled to {self.sic_codes}")  # Log
 
-        # NEW: Load improved SIC selector if audited (logs if found)
+        # NEW: Load improved SIC selector if audited (logs if found); prefers
+        # the build-time compiled module over re-parsing the JSON file
         rec_sic_file = "recommended_sic_selectors.json"
-        if os.path.exists(rec_sic_file):
-            with open(rec_sic_file, 'r') as f:
-                rec = json.load(f)
-                if 'nature_of_business_sic' in rec and rec['nature_of_business_sic']['value']:
-                    # Update selectors.json implicitly (or reload in scraper)
-                    print(f"Loaded audited SIC selector: {rec['nature_of_business_sic']['value'][0]} (from Colossus)")
-                else:
-                    print("Audited file exists but no SIC recs found.")
+        rec = _COMPILED_SELECTORS.get(rec_sic_file)
+        if rec is None and os.path.exists(rec_sic_file):
+            with open(rec_sic_file, 'rb') as f:
+                rec = orjson.loads(f.read())
+        if rec is not None:
+            if 'nature_of_business_sic' in rec and rec['nature_of_business_sic']['value']:
+                # Update selectors.json implicitly (or reload in scraper)
+                print(f"Loaded audited SIC selector: {rec['nature_of_business_sic']['value'][0]} (from Colossus)")
+            else:
+                print("Audited file exists but no SIC recs found.")
 
         # Rest: Random location
         if self.exhaustive_mode or self.random_location:
             self._select_random_location()
-    else:
-        print(f"Warning: {self.config_json_path} not found. Using defaults.")
 
     def _select_random_location(self):
         """Pick a random location from JSON and update target_location."""
         if self.locations:
-            loc = random.choice(self.locations)
+            loc = self.locations[_RNG.integers(len(self.locations))]
             self.target_location = loc['city_region']
             print(f"Selected random location: {self.target_location}")
 
     def _select_random_industry(self):
         """Pick random SIC codes from JSON and update sic_codes and target_industry."""
         if self.business_types:
-            industry = random.choice(self.business_types)
+            industry = self.business_types[_RNG.integers(len(self.business_types))]
             self.sic_codes = industry['key_sic_codes']
             self.target_industry = industry['example_industry']
             print(f"Selected random industry: {self.target_industry} (SIC: {self.sic_codes})")
 
+    # Memoized flattened views: computed on first touch, then served from the
+    # instance dict (business_types never changes mid-run)
+    @cached_property
+    def all_locations(self) -> List[str]:
+        """All city_regions from JSON, computed once per config instance."""
+        return [loc['city_region'] for loc in self.locations]
+
+    @cached_property
+    def all_sic_codes(self) -> List[str]:
+        """All unique SIC codes from JSON (sorted), computed once."""
+        if not self.business_types:
+            return []
+        codes = np.unique(np.concatenate(
+            [bt['key_sic_codes_int'] for bt in self.business_types]
+        ))
+        return [f"{c:05d}" for c in codes]
+
     def get_all_locations(self) -> List[str]:
         """Helper: Get list of all city_regions from JSON."""
-        return [loc['city_region'] for loc in self.locations]
+        return self.all_locations
 
     def get_all_sic_codes(self) -> List[str]:
         """Helper: Flatten all unique SIC codes from JSON."""
-        sics = set()
-        for bt in self.business_types:
-            sics.update(bt['key_sic_codes'])
-        return list(sics)
+        return self.all_sic_codes
+
+    @staticmethod
+    def _cycle(items: List[Any]) -> Any:
+        """Pick one entry uniformly. The old start_index+randint%len dance was
+        dead math: (start + U[0,n-1]) mod n is just U[0,n-1] again."""
+        return items[_RNG.integers(len(items))]
 
-    def cycle_locations(self, start_index: int = 0) -> str:
-        """For exhaustive mode: Cycle through locations starting from index."""
+    def cycle_locations(self) -> str:
+        """For exhaustive mode: Hop to another random location."""
         if self.locations:
-            idx = (start_index + random.randint(0, len(self.locations) - 1)) % len(self.locations)
-            loc = self.locations[idx]
-            self.target_location = loc['city_region']
-            return self.target_location
+            self.target_location = self._cycle(self.locations)['city_region']
         return self.target_location
 
-    def cycle_sic_codes(self, start_index: int = 0) -> List[str]:
-        """For exhaustive mode: Cycle through industries/SICs starting from index."""
+    def cycle_sic_codes(self) -> List[str]:
+        """For exhaustive mode: Hop to another random industry/SIC set."""
         if self.business_types:
-            idx = (start_index + random.randint(0, len(self.business_types) - 1)) % len(self.business_types)
-            industry = self.business_types[idx]
+            industry = self._cycle(self.business_types)
             self.sic_codes = industry['key_sic_codes']
             self.target_industry = industry['example_industry']
-            return self.sic_codes
-        return self.sic_codes
\ No newline at end of file
+        return self.sic_codes
+
+    # ✅ FIX: this was accidentally defined at module level (indentation bug),
+    # so the default SIC codes were never applied. It is a real method now.
+    def __post_init__(self):
+        """Sets default lists. JSON loading and smart selections are now lazy."""
+        # ✅ Initialize default SIC codes if empty
+        if not self.sic_codes:
+            self.sic_codes = [
+                "73110",  # Advertising agencies
+                "62012",  # Business and domestic software development
+                "62090",  # Other information technology service activities
+                "63110",  # Data processing, hosting and related activities
+                "63120",  # Web portals
+                "70229"   # Management consultancy activities other than financial management
+            ]
+        # The proxy_pool is fine as an empty list, so no changes needed for it here.
@@ -1,15 +1,31 @@
 # proof_bot/main.py
+import atexit
 import logging
-import json
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import asyncio
+import dataclasses
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from dataclasses import asdict
+from functools import cached_property
 
+import numpy as np
+import orjson
 import pandas as pd
 from github import Github
 import telegram
 
+# Optional: pyarrow's C++ CSV writer is much faster than pandas' row-by-row
+# default for large lead batches; fall back to to_csv when it's not installed.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 from .config import BotConfig
 from .scraper import EliteWebScraper
 from .outreach import PsychologyOutreachSystem
@@ -29,10 +45,17 @@ logging.basicConfig(
 # Dedicated logger for visited URLs to create a clean list for debugging
 url_logger = logging.getLogger('VisitedURLs')
 url_logger.setLevel(logging.INFO)
-# This handler will write to visited_urls.log with a very simple format
-url_handler = logging.FileHandler('visited_urls.log', 'w')
+# This handler will write to visited_urls.log with a very simple format.
+# Routed through a QueueHandler so per-URL logging during the scrape is just
+# an enqueue; a background QueueListener thread performs the actual writes.
+# Mode 'a' preserves prior runs instead of truncating on import.
+url_handler = logging.FileHandler('visited_urls.log', 'a')
 url_handler.setFormatter(logging.Formatter('%(asctime)s | %(message)s'))
-url_logger.addHandler(url_handler)
+_url_queue: queue.SimpleQueue = queue.SimpleQueue()
+_url_listener = QueueListener(_url_queue, url_handler)
+_url_listener.start()
+atexit.register(_url_listener.stop)  # stop() drains remaining records
+url_logger.addHandler(QueueHandler(_url_queue))
 
 
 logger = logging.getLogger('ProofBot')
@@ -46,14 +69,39 @@ class ProofBot:
         self.outreach = PsychologyOutreachSystem()
         self.leads = []
         self.campaigns = []
-        self.github = Github(config.github_token) if config.github_token and config.github_repo else None
-        self.telegram_bot = telegram.Bot(token=config.telegram_token) if config.telegram_token else None
+        self.avg_quality = 0.0
+        # One timestamp per run: single clock read, and the CSV/JSON exports
+        # share a consistent filename suffix
+        self.run_ts = datetime.now()
+        self.run_ts_str = self.run_ts.strftime('%Y%m%d_%H%M%S')
         logger.info("PROOF BOT v3.0 Initialized with Playwright Engine.")
 
+    # Lazy API clients: telegram.Bot builds an httpx pool and Github sets up a
+    # session on construction, so defer both until a step actually needs them
+    # (runs that fail early or skip step 4 never pay for it)
+    @cached_property
+    def github(self):
+        if self.config.github_token and self.config.github_repo:
+            return Github(self.config.github_token)
+        return None
+
+    @cached_property
+    def telegram_bot(self):
+        if self.config.telegram_token:
+            return telegram.Bot(token=self.config.telegram_token)
+        return None
+
     async def run(self):
         """Asynchronous main execution flow of the bot."""
+        # Smart selection is now lazy; only touch the locations/SICs JSON when
+        # a run actually uses one of the dynamic selection modes.
+        if self.config.exhaustive_mode or self.config.random_location or self.config.random_industry:
+            self.config.apply_smart_selection()
+
         logger.info("📊 Step 1: Scraping and enriching leads...")
         self.leads = await self.scraper.run_scraper()
+        # Score the whole batch in one vectorized pass instead of per-Lead loops
+        Lead.score_batch(self.leads)
         logger.info(f"✅ Found and enriched {len(self.leads)} qualified leads.")
 
         if not self.leads:
@@ -70,11 +118,22 @@ class ProofBot:
             self.leads = [mock_lead]
             logger.info("Added mock lead to proceed with campaigns.")
 
+        # One C-level reduction shared by the GitHub update and the summary,
+        # instead of each re-summing the lead list in Python
+        self.avg_quality = float(np.fromiter(
+            (l.data_quality_score for l in self.leads), dtype=np.float32, count=len(self.leads)
+        ).mean()) if self.leads else 0.0
+
         logger.info("\n✉️ Step 2: Generating personalized outreach campaigns...")
-        for lead in self.leads:
-            # FIX: Use the correct method name 'generate_email' from outreach.py
-            campaign = self.outreach.generate_email(lead)
-            self.campaigns.append(campaign)
+        # Fan generation out across a small thread pool; results come back in
+        # lead order. Pays off as soon as generate_email touches the network
+        # (e.g. the OpenAI key in config), and is harmless for the local path.
+        # Pre-size the result list (the lead count is known up front) and fill
+        # by index, instead of letting list() regrow geometrically
+        self.campaigns = [None] * len(self.leads)
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as ex:
+            for i, campaign in enumerate(ex.map(self.outreach.generate_email, self.leads)):
+                self.campaigns[i] = campaign
         logger.info(f"✅ Generated {len(self.campaigns)} outreach campaigns.")
         
         logger.info("\n📁 Step 3: Exporting results...")
@@ -82,24 +141,56 @@ class ProofBot:
         self.export_campaigns_to_json()
 
         logger.info("\n📱 Step 4: Sending updates and publishing portfolio...")
-        await self.send_telegram_summary() # Changed to await
-        self.update_github_portfolio()
+        # Both are network-bound and independent; overlap the async Telegram
+        # send with the sync-blocking PyGithub update on a worker thread
+        await asyncio.gather(
+            self.send_telegram_summary(),
+            asyncio.to_thread(self.update_github_portfolio),
+        )
         
         self.display_summary()
 
+    # Column order + one attrgetter, built once; avoids dataclasses.asdict's
+    # recursive deep copy of every list field per exported lead. Underscored
+    # fields are internal caches, not export columns.
+    _LEAD_FIELDS = tuple(
+        f.name for f in dataclasses.fields(Lead) if not f.name.startswith('_')
+    )
+    _LEAD_GETTER = operator.attrgetter(*_LEAD_FIELDS)
+
     def export_to_csv(self):
         if not self.leads: return
-        df = pd.DataFrame([asdict(lead) for lead in self.leads])
-        filename = f"exports/leads_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        df = pd.DataFrame.from_records(
+            (self._LEAD_GETTER(lead) for lead in self.leads), columns=self._LEAD_FIELDS
+        )
+        filename = f"exports/leads_{self.run_ts_str}.csv"
         os.makedirs('exports', exist_ok=True)
-        df.to_csv(filename, index=False)
+        if PYARROW_AVAILABLE:
+            try:
+                # Arrow can't hold the nested officer/list columns natively, so
+                # stringify those (to_csv would render them as str anyway)
+                out = df.copy()
+                for col in out.columns:
+                    if out[col].dtype == object:
+                        out[col] = out[col].map(
+                            lambda v: str(v) if isinstance(v, (list, dict)) else v
+                        )
+                pa_csv.write_csv(pa.Table.from_pandas(out, preserve_index=False), filename)
+            except Exception as e:
+                logger.debug(f"pyarrow CSV export failed ({e}); falling back to pandas.")
+                df.to_csv(filename, index=False)
+        else:
+            df.to_csv(filename, index=False)
         logger.info(f"📄 Exported leads to {filename}")
 
     def export_campaigns_to_json(self):
         if not self.campaigns: return
-        filename = f"exports/campaigns_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, 'w') as f:
-            json.dump(self.campaigns, f, indent=2, default=str)
+        filename = f"exports/campaigns_{self.run_ts_str}.json"
+        # orjson serializes natively in C and returns bytes, hence the 'wb' mode.
+        # Campaign payloads are plain string dicts (generate_email pre-converts
+        # anything non-native), so no default= fallback callback is needed.
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(self.campaigns, option=orjson.OPT_INDENT_2))
         logger.info(f"📄 Exported campaigns to {filename}")
         
     async def send_telegram_summary(self): # Made async
@@ -125,28 +216,63 @@ class ProofBot:
         except Exception as e:
             logger.error(f"Failed to send Telegram summary: {e}")
 
+    # Local state so the README SHA survives across runs; saves the
+    # get_contents round-trip (and its rate-limit cost) on every update
+    STATE_FILE = '.proof_bot_state.json'
+
+    def _load_state(self) -> dict:
+        try:
+            with open(self.STATE_FILE, 'rb') as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+
+    def _save_state(self, state: dict):
+        try:
+            with open(self.STATE_FILE, 'wb') as f:
+                f.write(orjson.dumps(state))
+        except OSError as e:
+            logger.debug(f"Could not persist state file: {e}")
+
     def update_github_portfolio(self):
         if not self.github:
             logger.warning("GitHub token/repo missing. Skipping.") # Removed "or no leads found" as it's not strictly a dependency for updating README.
             return
-        
+
         try:
             repo = self.github.get_repo(self.config.github_repo)
-            readme_content = f"# SDR Lead Generation Portfolio\n\n_Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}_\n\n"
-            
+            readme_content = f"# SDR Lead Generation Portfolio\n\n_Last updated: {self.run_ts.strftime('%Y-%m-%d %H:%M')}_\n\n"
+
             if self.leads: # Only include lead-specific stats if leads exist
-                readme_content += f"**Latest Run Results:**\n- Leads Generated: {len(self.leads)}\n- Average Quality Score: {sum(l.data_quality_score for l in self.leads) / len(self.leads):.1f}%\n"
+                readme_content += f"**Latest Run Results:**\n- Leads Generated: {len(self.leads)}\n- Average Quality Score: {self.avg_quality:.1f}%\n"
             else:
                 readme_content += "**Latest Run Results:**\n- No leads generated in this run.\n"
-            
-            # Check if README exists before trying to update
+
+            state = self._load_state()
+            cached_sha = state.get('last_readme_sha')
+
+            # Fast path: update straight away with the SHA cached from the
+            # previous run, skipping the get_contents probe entirely
+            if cached_sha:
+                try:
+                    result = repo.update_file("README.md", "Automated portfolio update", readme_content, cached_sha)
+                    state['last_readme_sha'] = result['content'].sha
+                    self._save_state(state)
+                    logger.info("🐙 GitHub portfolio updated (cached SHA).")
+                    return
+                except Exception: # 409/422 on SHA mismatch: someone else pushed
+                    logger.debug("Cached README SHA stale; refetching.")
+
+            # Slow path: probe for the file, then update or create it
             try:
                 contents = repo.get_contents("README.md")
-                repo.update_file(contents.path, f"Automated portfolio update", readme_content, contents.sha)
+                result = repo.update_file(contents.path, "Automated portfolio update", readme_content, contents.sha)
                 logger.info("🐙 GitHub portfolio updated.")
             except Exception: # If get_contents fails (e.g., file not found), create it
-                repo.create_file("README.md", "Create portfolio", readme_content)
+                result = repo.create_file("README.md", "Create portfolio", readme_content)
                 logger.info("🐙 Created and populated GitHub portfolio.")
+            state['last_readme_sha'] = result['content'].sha
+            self._save_state(state)
 
         except Exception as e:
             logger.error(f"Failed to update GitHub portfolio: {e}")
@@ -156,8 +282,7 @@ class ProofBot:
             logger.info("Run complete. No leads were found.")
             return
             
-        avg_quality = sum(l.data_quality_score for l in self.leads) / len(self.leads)
-        print(f"\n--- EXECUTION COMPLETE ---\nTotal Leads: {len(self.leads)}\nAvg. Quality: {avg_quality:.1f}%\n--------------------------\n")
+        print(f"\n--- EXECUTION COMPLETE ---\nTotal Leads: {len(self.leads)}\nAvg. Quality: {self.avg_quality:.1f}%\n--------------------------\n")
 
 async def main():
     """Main asynchronous entry point for the application."""
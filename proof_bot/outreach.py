@@ -2,7 +2,20 @@
 import logging
 import re
 import random
-from typing import Dict, List, Optional, Any
+import string
+import sys
+import types
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
+
+# Optional: pyahocorasick matches all industry keywords in one linear pass
+# over the company name; we fall back to the per-industry regexes without it.
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # The relative import below is correct when running as part of the 'proof_bot' package.
 # However, it will show an error in VS Code when run as a standalone file.
@@ -11,387 +24,583 @@ from typing import Dict, List, Optional, Any
 
 class Lead:
     """Placeholder for the actual Lead model for standalone script execution."""
+    # Match the real model's slotted layout: no per-instance __dict__
+    __slots__ = ('company_name', 'ceo_name', 'location', 'name_lower', 'ceo_first')
+
     def __init__(self, company_name: str, ceo_name: Optional[str] = None, location: Optional[str] = None):
         self.company_name = company_name
         self.ceo_name = ceo_name
         self.location = location if location else ""
+        # Mirror the real model's derived caches: lowered/split once at
+        # construction instead of on every generate_email call
+        self.name_lower = company_name if company_name.islower() else company_name.lower()
+        self.ceo_first = ceo_name.split(' ', 1)[0].strip() if ceo_name else ""
 
 logger = logging.getLogger('ProofBot.Outreach')
 
+
+def _lower(s: str) -> str:
+    """Lowercase that skips the copy when the string is already lowercase.
+
+    islower() is a pure-C scan with no allocation, so the common
+    already-lowercase case (frequent for location strings) costs no malloc.
+    """
+    return s if s.islower() else s.lower()
+
+
+def _freeze(value):
+    """Recursively convert framework lists to tuples (immutable, contiguous).
+
+    Keys are interned on the way through: lookups on the framework mappings
+    then short-circuit on pointer equality instead of full string compares.
+    """
+    if isinstance(value, dict):
+        return {sys.intern(k): _freeze(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class _SafeDict(dict):
+    """Leaves unknown {placeholders} intact so format_map never raises."""
+    def __missing__(self, key):
+        return '{' + key + '}'
+
+# ---------------------------------------------------------------------------
+# Psychology frameworks: static data, so built once at import time and shared
+# across every PsychologyOutreachSystem instance (a worker pool creating a
+# fresh system per job pays nothing beyond reference binding).
+# ---------------------------------------------------------------------------
+
+# Industry-specific pain points, value props, and case studies
+_INDUSTRY_PATTERNS = {
+    'automotive': {
+        'keywords': ['cars', 'automotive', 'motors', 'garage', 'vehicle', 'auto'],
+        'pain_points': [
+            "keeping your service bays filled during quiet periods",
+            "managing customer bookings efficiently",
+            "competing with larger dealership groups",
+            "attracting younger customers who research online first"
+        ],
+        'value_props': [
+            "We help independent garages fill 23% more appointments through local digital presence",
+            "Our automotive clients see an average 34% increase in service bookings",
+            "We've helped 12 independent garages compete effectively against dealerships"
+        ],
+        'case_studies': [
+            "A local garage in Manchester increased their MOT bookings by 156% in 90 days",
+            "An independent dealer we work with now gets 40+ qualified enquiries per month"
+        ]
+    },
+    'food_beverage': {
+        'keywords': ['kitchen', 'bakery', 'bar', 'cafe', 'restaurant', 'food', 'catering'],
+        'pain_points': [
+            "filling tables during off-peak hours",
+            "standing out in a crowded local market",
+            "managing online reviews and reputation",
+            "attracting customers beyond your immediate area"
+        ],
+        'value_props': [
+            "We've helped local restaurants increase covers by 28% during quiet periods",
+            "Our F&B clients average 4.6-star ratings with 3x more reviews",
+            "We specialize in hyper-local marketing that fills seats"
+        ],
+        'case_studies': [
+            "A London bar we work with increased Tuesday-Thursday covers by 67%",
+            "One bakery client went from 12 to 87 Google reviews in 4 months"
+        ]
+    },
+    'beauty_personal': {
+        'keywords': ['beauty', 'beauties', 'hair', 'salon', 'spa', 'cuts', 'barber'],
+        'pain_points': [
+            "reducing no-shows and last-minute cancellations",
+            "keeping your appointment book full",
+            "attracting higher-value clients",
+            "standing out from competition on your high street"
+        ],
+        'value_props': [
+            "Our beauty clients reduce no-shows by 67% with our booking system",
+            "We help salons increase average transaction value by £32",
+            "We've filled 890+ appointment slots for beauty businesses this year"
+        ],
+        'case_studies': [
+            "A Birmingham salon increased their average ticket from £45 to £78",
+            "One barber shop reduced no-shows from 18% to just 3%"
+        ]
+    },
+    'childcare': {
+        'keywords': ['childcare', 'nursery', 'nurseries', 'kids', 'children', 'baby'],
+        'pain_points': [
+            "maintaining full enrollment throughout the year",
+            "communicating your unique approach to anxious parents",
+            "standing out from larger nursery chains",
+            "building trust with parents who are researching online"
+        ],
+        'value_props': [
+            "We help independent nurseries maintain 95%+ occupancy year-round",
+            "Our childcare clients see 3x more qualified parent enquiries",
+            "We specialize in building trust that converts concerned parents into enrollments"
+        ],
+        'case_studies': [
+            "A local nursery went from 78% to 98% occupancy in 5 months",
+            "One childcare provider now has a 6-month waiting list"
+        ]
+    },
+    'retail': {
+        'keywords': ['shop', 'store', 'retail', 'mart', 'minimart', 'market'],
+        'pain_points': [
+            "competing with online retailers and supermarkets",
+            "driving foot traffic during quiet periods",
+            "building customer loyalty in your local area",
+            "showcasing your unique products to the right audience"
+        ],
+        'value_props': [
+            "We've helped local retailers increase foot traffic by 41%",
+            "Our retail clients see average basket sizes increase by £18",
+            "We specialize in hyper-local campaigns that drive customers to your door"
+        ],
+        'case_studies': [
+            "A local shop increased daily footfall from 34 to 89 customers",
+            "One retailer's repeat customer rate jumped from 22% to 61%"
+        ]
+    },
+    'property': {
+        'keywords': ['property', 'properties', 'estate', 'developments', 'housing'],
+        'pain_points': [
+            "generating qualified buyer/tenant leads consistently",
+            "standing out in a saturated property market",
+            "reducing time properties stay on your books",
+            "competing with larger estate agency chains"
+        ],
+        'value_props': [
+            "We help independent agents generate 3x more qualified property leads",
+            "Our property clients reduce average time to let/sell by 23 days",
+            "We've helped 17 independent agents compete successfully against major chains"
+        ],
+        'case_studies': [
+            "An independent agent went from 4 to 23 qualified leads per month",
+            "One property company reduced their average time to let from 67 to 31 days"
+        ]
+    },
+    'professional_services': {
+        'keywords': ['accountant', 'accounting', 'consulting', 'advisor', 'advisors', 'legal', 'solicitor'],
+        'pain_points': [
+            "attracting higher-value clients consistently",
+            "differentiating from other local firms",
+            "generating referrals beyond your existing network",
+            "establishing expertise and trust online"
+        ],
+        'value_props': [
+            "We help professional firms attract 40% more qualified leads",
+            "Our clients see average engagement value increase by £4,200",
+            "We specialize in positioning that attracts premium clients"
+        ],
+        'case_studies': [
+            "An accounting firm increased average client value from £2,400 to £7,100",
+            "One consulting practice generated £340k in new business in 6 months"
+        ]
+    },
+    'tech_digital': {
+        'keywords': ['software', 'digital', 'tech', 'coding', 'media', 'design', 'web'],
+        'pain_points': [
+            "finding clients who understand the value you provide",
+            "standing out in a crowded digital services market",
+            "generating consistent project pipeline",
+            "commanding premium rates for your expertise"
+        ],
+        'value_props': [
+            "We help digital agencies generate 52% more qualified project leads",
+            "Our tech clients increase average project value by £12,000",
+            "We specialize in positioning that attracts clients who value quality"
+        ],
+        'case_studies': [
+            "A digital agency went from £8k to £31k average project value",
+            "One software company generated 34 qualified demos in 90 days"
+        ]
+    },
+    'construction_trades': {
+        'keywords': ['building', 'construction', 'doors', 'windows', 'roofing', 'plumbing', 'developments'],
+        'pain_points': [
+            "keeping your project pipeline full year-round",
+            "attracting higher-value residential or commercial projects",
+            "reducing reliance on word-of-mouth alone",
+            "standing out from cheaper competition"
+        ],
+        'value_props': [
+            "We help trade businesses maintain 92% capacity utilization",
+            "Our construction clients see average project value increase by £7,800",
+            "We've generated £2.4M in project pipeline for trades this year"
+        ],
+        'case_studies': [
+            "A local builder went from 3 to 11 projects in their pipeline",
+            "One tradesman increased average job value from £3,200 to £9,400"
+        ]
+    },
+    'investment_finance': {
+        'keywords': ['investment', 'investments', 'capital', 'finance', 'funding'],
+        'pain_points': [
+            "attracting qualified high-net-worth clients",
+            "building trust in a skeptical market",
+            "differentiating from larger institutions",
+            "demonstrating expertise and track record"
+        ],
+        'value_props': [
+            "We help investment firms attract 3x more qualified HNW leads",
+            "Our clients see average client AUM increase by 47%",
+            "We specialize in trust-building that converts cautious investors"
+        ],
+        'case_studies': [
+            "One investment firm attracted £12M in new AUM in 8 months",
+            "A financial advisor doubled their qualified consultation requests"
+        ]
+    },
+    'general_business': {
+        'keywords': ['limited', 'ltd', 'associates', 'group', 'global', 'alliance', 'cic'],
+        'pain_points': [
+            "generating consistent quality leads for your business",
+            "standing out in your local market",
+            "maximizing the return on your marketing investment",
+            "building a predictable growth engine"
+        ],
+        'value_props': [
+            "We help UK small businesses increase qualified leads by 47%",
+            "Our clients see an average ROI of 340% within 6 months",
+            "We've helped 127 UK businesses build predictable growth systems"
+        ],
+        'case_studies': [
+            "A local business went from 5 to 28 qualified leads per month",
+            "One SME increased revenue by £180k in their first year with us"
+        ]
+    }
+}
+
+# UK location-specific hooks and context
+_LOCATION_HOOKS = {
+    'london': {
+        'hook': "In a market as competitive as London",
+        'context': "London businesses",
+        'challenge': "standing out in the capital's crowded marketplace"
+    },
+    'birmingham': {
+        'hook': "In Birmingham's growing business ecosystem",
+        'context': "Birmingham businesses",
+        'challenge': "capturing market share in the Midlands' largest city"
+    },
+    'manchester': {
+        'hook': "In Manchester's competitive market",
+        'context': "Manchester businesses",
+        'challenge': "thriving in the Northwest's business hub"
+    },
+    'scotland': {
+        'hook': "In the Scottish market",
+        'context': "Scottish businesses",
+        'challenge': "growing your presence across Scotland"
+    },
+    'wales': {
+        'hook': "In the Welsh business community",
+        'context': "Welsh businesses",
+        'challenge': "expanding in the Welsh market"
+    },
+    'liverpool': {
+        'hook': "In Liverpool's vibrant business scene",
+        'context': "Liverpool businesses",
+        'challenge': "standing out in Merseyside"
+    },
+    'leeds': {
+        'hook': "In Leeds' competitive environment",
+        'context': "Leeds businesses",
+        'challenge': "growing in Yorkshire's business capital"
+    },
+    'default': {
+        'hook': "In your local market",
+        'context': "local businesses",
+        'challenge': "standing out from your competition"
+    }
+}
+
+# SPIN Framework questions
+_SPIN_FRAMEWORK = {
+    'situation': [
+        "How are you currently attracting new customers to {company_name}?",
+        "What's been your main source of new business over the past 6 months?",
+        "How much time do you spend on business development each week?",
+        "Who's responsible for bringing in new clients at {company_name}?"
+    ],
+    'problem': [
+        "Are you finding it challenging to generate consistent leads?",
+        "Is it getting harder to stand out from local competition?",
+        "Do you worry about feast-or-famine in your pipeline?",
+        "Are you relying too heavily on word-of-mouth alone?"
+    ],
+    'implication': [
+        "What happens to {company_name} if your main lead source dries up?",
+        "How much revenue are you leaving on the table with an inconsistent pipeline?",
+        "What's it costing you to turn away work because you're too busy, then go quiet?",
+        "How is unpredictable revenue affecting your ability to plan and invest?"
+    ],
+    'need_payoff': [
+        "How valuable would it be to have a predictable flow of qualified leads?",
+        "What would it mean for {company_name} to reduce customer acquisition costs by 40%?",
+        "How would your business transform with a full pipeline year-round?",
+        "What could you achieve if marketing became your competitive advantage?"
+    ]
+}
+
+# Influence principles (Cialdini)
+_INFLUENCE_PRINCIPLES = {
+    'social_proof': [
+        "We work with {number} other {industry} businesses in your area",
+        "{competitor_type} businesses are increasingly using this approach",
+        "This is becoming the standard for successful {industry} companies"
+    ],
+    'scarcity': [
+        "We only take on {number} new clients per quarter to maintain quality",
+        "We're booking consultations for {month} right now",
+        "This approach works best when implemented before your busy season"
+    ],
+    'authority': [
+        "We've generated over £{amount} in revenue for {industry} businesses",
+        "Our team has {number} years of experience in {industry} marketing",
+        "We've helped {number} businesses in your sector achieve {result}"
+    ],
+    'reciprocity': [
+        "I'd be happy to share our {industry} benchmark report with you",
+        "I can send you a quick analysis of your current online presence",
+        "Would a 15-minute marketing diagnostic be valuable?"
+    ]
+}
+
+# Objection handling frameworks
+_OBJECTION_RESPONSES = {
+    'too_busy': {
+        'empathy': "I completely understand - that's exactly why this might be perfect timing.",
+        'reframe': "The businesses I work with were too busy to think about marketing... until their pipeline dried up.",
+        'close': "Can we schedule 15 minutes next week when you're less rushed?",
+        'alternative': "What if I sent you a 2-minute video explaining how this works, and you can watch it when convenient?"
+    },
+    'happy_with_current': {
+        'empathy': "That's great to hear - it sounds like things are working well right now.",
+        'reframe': "Can I ask - if what you're doing now suddenly stopped working tomorrow, what would be your backup plan?",
+        'insight': "That's the exact situation we help prevent. Even successful businesses benefit from diversifying their lead sources.",
+        'close': "Would it be worth a quick conversation just to explore what else might be possible?"
+    },
+    'too_expensive': {
+        'empathy': "I appreciate the concern about cost - that's always an important consideration.",
+        'reframe': "Here's what I've found: most {industry} businesses waste money on marketing that doesn't work. Our approach is about spending smarter, not more.",
+        'value': "Our clients typically see ROI within 90 days, and the cost is less than hiring one part-time person.",
+        'close': "Would you be open to a quick diagnostic to see where you might be leaving money on the table?"
+    },
+    'send_information': {
+        'empathy': "I could absolutely send information.",
+        'reframe': "But honestly, 90% of it won't apply to {company_name} specifically.",
+        'alternative': "What if we spent 15 minutes, I learn about your specific situation, and then I send you something actually relevant?",
+        'close': "Would Tuesday or Wednesday work better?"
+    }
+}
+
+# Freeze every framework sub-list into a tuple: the data is static, and
+# tuples are smaller and cheaper to iterate than lists of the same strings.
+# The read-only proxy keeps the shared top-level mappings from being mutated
+# by one instance under every other instance's feet.
+_INDUSTRY_PATTERNS = types.MappingProxyType(_freeze(_INDUSTRY_PATTERNS))
+_LOCATION_HOOKS = types.MappingProxyType(_freeze(_LOCATION_HOOKS))
+_SPIN_FRAMEWORK = types.MappingProxyType(_freeze(_SPIN_FRAMEWORK))
+_INFLUENCE_PRINCIPLES = types.MappingProxyType(_freeze(_INFLUENCE_PRINCIPLES))
+_OBJECTION_RESPONSES = types.MappingProxyType(_freeze(_OBJECTION_RESPONSES))
+
+# One alternation over the known cities; a single C-level search
+# replaces the per-city substring loop in _identify_location_data
+_CITY_RE = re.compile('|'.join(
+    re.escape(city) for city in _LOCATION_HOOKS if city != 'default'
+))
+
+# Structure-of-arrays views over industry_patterns: parallel tuples
+# indexed by a small integer industry id, so the per-lead path indexes
+# flat arrays instead of chasing dict-of-dicts lookups per field.
+# Enumeration order doubles as the tie-break priority (first listed
+# industry wins, matching the original dict-order scan).
+_INDUSTRY_NAMES = tuple(_INDUSTRY_PATTERNS)
+_INDUSTRY_IDS = {name: i for i, name in enumerate(_INDUSTRY_NAMES)}
+_buckets = tuple(_INDUSTRY_PATTERNS.values())
+_KEYWORD_SETS = tuple(frozenset(d['keywords']) for d in _buckets)
+_PAINS = tuple(d['pain_points'] for d in _buckets)
+_VALUES = tuple(d['value_props'] for d in _buckets)
+_CASES = tuple(d['case_studies'] for d in _buckets)
+_GENERAL_ID = _INDUSTRY_IDS['general_business']
+_NEED_PAYOFF = _SPIN_FRAMEWORK['need_payoff']
+del _buckets
+
+# One master alternation with a named group per industry: a single
+# call into the C regex engine classifies the whole name, and the
+# leftmost keyword occurrence decides between industries.
+# general_business is excluded: it is the no-match fallback, and its
+# generic keywords ('limited', 'group', ...) occurring early in a name
+# would otherwise pre-empt a specific industry further along.
+_INDUSTRY_MASTER = re.compile('|'.join(
+    '(?P<%s>\\b(?:%s)\\b)' % (name, '|'.join(re.escape(k) for k in d['keywords']))
+    for name, d in _INDUSTRY_PATTERNS.items()
+    if name != 'general_business'
+))
+
+# Aho-Corasick automaton over all keywords at once: O(len(name))
+# regardless of how many keywords the frameworks grow to.
+# {placeholder} -> ${placeholder} rewrite for handing partially-filled
+# templates to string.Template (whose substitution runs as one C call).
+_BRACE_RE = re.compile(r'\{(\w+)\}')
+
+# Body template as one module-level constant: a single C-level format_map
+# pass fills it, with no per-call template reassembly or intermediate buffers.
+_BODY_TMPL = (
+    "Noticed {company_name} and wanted to reach out. {location_hook}, "
+    "I imagine that {challenge} is a constant focus.\n\n"
+    "We often speak with {industry} businesses facing challenges with {pain_point}. "
+    "This is an area we specialize in. For context, {value_prop}.\n\n"
+    "To give you a real-world example, {case_study}."
+)
+
+if AHOCORASICK_AVAILABLE:
+    _INDUSTRY_AUTOMATON = ahocorasick.Automaton()
+    for _industry_id, _keywords in enumerate(_KEYWORD_SETS):
+        # Fallback bucket stays out of the automaton, mirroring its
+        # exclusion from the master regex above
+        if _industry_id == _GENERAL_ID:
+            continue
+        for _kw in _keywords:
+            # add_word overwrites on duplicate keys, so a keyword shared by
+            # two industries (e.g. 'developments' in both property and
+            # construction_trades) must keep its first — highest-priority —
+            # industry id to agree with the regex fallback's dict-order scan
+            if _kw not in _INDUSTRY_AUTOMATON:
+                _INDUSTRY_AUTOMATON.add_word(_kw, (_industry_id, _kw))
+    _INDUSTRY_AUTOMATON.make_automaton()
+    del _industry_id, _keywords, _kw
+else:
+    _INDUSTRY_AUTOMATON = None
+
+
 class PsychologyOutreachSystem:
     """
     Advanced outreach generator using proven sales psychology to create
     highly personalized and effective communication for leads.
     """
 
+    # Slot-based attribute access through the C descriptor on the hot path,
+    # and no per-instance __dict__ (all attributes are fixed at init)
+    __slots__ = (
+        '_rng', 'industry_patterns', 'location_hooks', 'spin_framework',
+        'influence_principles', 'objection_responses', '_city_re',
+        '_industry_names', '_industry_ids', '_keyword_sets', '_pains',
+        '_values', '_cases', '_general_id', '_industry_master',
+        '_industry_automaton', '_need_payoff',
+    )
+
     def __init__(self):
         """Initializes the outreach system and loads all frameworks."""
+        # Instance-local generator: skips the module-level random.* indirection
+        # through the shared global Random on the per-lead hot path
+        self._rng = random.Random()
         self.load_psychology_frameworks()
         logger.info("Psychology Outreach System initialized.")
 
     def load_psychology_frameworks(self):
-        """Loads all psychological frameworks, industry data, and templates."""
-
-        # Industry-specific pain points, value props, and case studies
-        self.industry_patterns = {
-            'automotive': {
-                'keywords': ['cars', 'automotive', 'motors', 'garage', 'vehicle', 'auto'],
-                'pain_points': [
-                    "keeping your service bays filled during quiet periods",
-                    "managing customer bookings efficiently",
-                    "competing with larger dealership groups",
-                    "attracting younger customers who research online first"
-                ],
-                'value_props': [
-                    "We help independent garages fill 23% more appointments through local digital presence",
-                    "Our automotive clients see an average 34% increase in service bookings",
-                    "We've helped 12 independent garages compete effectively against dealerships"
-                ],
-                'case_studies': [
-                    "A local garage in Manchester increased their MOT bookings by 156% in 90 days",
-                    "An independent dealer we work with now gets 40+ qualified enquiries per month"
-                ]
-            },
-            'food_beverage': {
-                'keywords': ['kitchen', 'bakery', 'bar', 'cafe', 'restaurant', 'food', 'catering'],
-                'pain_points': [
-                    "filling tables during off-peak hours",
-                    "standing out in a crowded local market",
-                    "managing online reviews and reputation",
-                    "attracting customers beyond your immediate area"
-                ],
-                'value_props': [
-                    "We've helped local restaurants increase covers by 28% during quiet periods",
-                    "Our F&B clients average 4.6-star ratings with 3x more reviews",
-                    "We specialize in hyper-local marketing that fills seats"
-                ],
-                'case_studies': [
-                    "A London bar we work with increased Tuesday-Thursday covers by 67%",
-                    "One bakery client went from 12 to 87 Google reviews in 4 months"
-                ]
-            },
-            'beauty_personal': {
-                'keywords': ['beauty', 'beauties', 'hair', 'salon', 'spa', 'cuts', 'barber'],
-                'pain_points': [
-                    "reducing no-shows and last-minute cancellations",
-                    "keeping your appointment book full",
-                    "attracting higher-value clients",
-                    "standing out from competition on your high street"
-                ],
-                'value_props': [
-                    "Our beauty clients reduce no-shows by 67% with our booking system",
-                    "We help salons increase average transaction value by £32",
-                    "We've filled 890+ appointment slots for beauty businesses this year"
-                ],
-                'case_studies': [
-                    "A Birmingham salon increased their average ticket from £45 to £78",
-                    "One barber shop reduced no-shows from 18% to just 3%"
-                ]
-            },
-            'childcare': {
-                'keywords': ['childcare', 'nursery', 'nurseries', 'kids', 'children', 'baby'],
-                'pain_points': [
-                    "maintaining full enrollment throughout the year",
-                    "communicating your unique approach to anxious parents",
-                    "standing out from larger nursery chains",
-                    "building trust with parents who are researching online"
-                ],
-                'value_props': [
-                    "We help independent nurseries maintain 95%+ occupancy year-round",
-                    "Our childcare clients see 3x more qualified parent enquiries",
-                    "We specialize in building trust that converts concerned parents into enrollments"
-                ],
-                'case_studies': [
-                    "A local nursery went from 78% to 98% occupancy in 5 months",
-                    "One childcare provider now has a 6-month waiting list"
-                ]
-            },
-            'retail': {
-                'keywords': ['shop', 'store', 'retail', 'mart', 'minimart', 'market'],
-                'pain_points': [
-                    "competing with online retailers and supermarkets",
-                    "driving foot traffic during quiet periods",
-                    "building customer loyalty in your local area",
-                    "showcasing your unique products to the right audience"
-                ],
-                'value_props': [
-                    "We've helped local retailers increase foot traffic by 41%",
-                    "Our retail clients see average basket sizes increase by £18",
-                    "We specialize in hyper-local campaigns that drive customers to your door"
-                ],
-                'case_studies': [
-                    "A local shop increased daily footfall from 34 to 89 customers",
-                    "One retailer's repeat customer rate jumped from 22% to 61%"
-                ]
-            },
-            'property': {
-                'keywords': ['property', 'properties', 'estate', 'developments', 'housing'],
-                'pain_points': [
-                    "generating qualified buyer/tenant leads consistently",
-                    "standing out in a saturated property market",
-                    "reducing time properties stay on your books",
-                    "competing with larger estate agency chains"
-                ],
-                'value_props': [
-                    "We help independent agents generate 3x more qualified property leads",
-                    "Our property clients reduce average time to let/sell by 23 days",
-                    "We've helped 17 independent agents compete successfully against major chains"
-                ],
-                'case_studies': [
-                    "An independent agent went from 4 to 23 qualified leads per month",
-                    "One property company reduced their average time to let from 67 to 31 days"
-                ]
-            },
-            'professional_services': {
-                'keywords': ['accountant', 'accounting', 'consulting', 'advisor', 'advisors', 'legal', 'solicitor'],
-                'pain_points': [
-                    "attracting higher-value clients consistently",
-                    "differentiating from other local firms",
-                    "generating referrals beyond your existing network",
-                    "establishing expertise and trust online"
-                ],
-                'value_props': [
-                    "We help professional firms attract 40% more qualified leads",
-                    "Our clients see average engagement value increase by £4,200",
-                    "We specialize in positioning that attracts premium clients"
-                ],
-                'case_studies': [
-                    "An accounting firm increased average client value from £2,400 to £7,100",
-                    "One consulting practice generated £340k in new business in 6 months"
-                ]
-            },
-            'tech_digital': {
-                'keywords': ['software', 'digital', 'tech', 'coding', 'media', 'design', 'web'],
-                'pain_points': [
-                    "finding clients who understand the value you provide",
-                    "standing out in a crowded digital services market",
-                    "generating consistent project pipeline",
-                    "commanding premium rates for your expertise"
-                ],
-                'value_props': [
-                    "We help digital agencies generate 52% more qualified project leads",
-                    "Our tech clients increase average project value by £12,000",
-                    "We specialize in positioning that attracts clients who value quality"
-                ],
-                'case_studies': [
-                    "A digital agency went from £8k to £31k average project value",
-                    "One software company generated 34 qualified demos in 90 days"
-                ]
-            },
-            'construction_trades': {
-                'keywords': ['building', 'construction', 'doors', 'windows', 'roofing', 'plumbing', 'developments'],
-                'pain_points': [
-                    "keeping your project pipeline full year-round",
-                    "attracting higher-value residential or commercial projects",
-                    "reducing reliance on word-of-mouth alone",
-                    "standing out from cheaper competition"
-                ],
-                'value_props': [
-                    "We help trade businesses maintain 92% capacity utilization",
-                    "Our construction clients see average project value increase by £7,800",
-                    "We've generated £2.4M in project pipeline for trades this year"
-                ],
-                'case_studies': [
-                    "A local builder went from 3 to 11 projects in their pipeline",
-                    "One tradesman increased average job value from £3,200 to £9,400"
-                ]
-            },
-            'investment_finance': {
-                'keywords': ['investment', 'investments', 'capital', 'finance', 'funding'],
-                'pain_points': [
-                    "attracting qualified high-net-worth clients",
-                    "building trust in a skeptical market",
-                    "differentiating from larger institutions",
-                    "demonstrating expertise and track record"
-                ],
-                'value_props': [
-                    "We help investment firms attract 3x more qualified HNW leads",
-                    "Our clients see average client AUM increase by 47%",
-                    "We specialize in trust-building that converts cautious investors"
-                ],
-                'case_studies': [
-                    "One investment firm attracted £12M in new AUM in 8 months",
-                    "A financial advisor doubled their qualified consultation requests"
-                ]
-            },
-            'general_business': {
-                'keywords': ['limited', 'ltd', 'associates', 'group', 'global', 'alliance', 'cic'],
-                'pain_points': [
-                    "generating consistent quality leads for your business",
-                    "standing out in your local market",
-                    "maximizing the return on your marketing investment",
-                    "building a predictable growth engine"
-                ],
-                'value_props': [
-                    "We help UK small businesses increase qualified leads by 47%",
-                    "Our clients see an average ROI of 340% within 6 months",
-                    "We've helped 127 UK businesses build predictable growth systems"
-                ],
-                'case_studies': [
-                    "A local business went from 5 to 28 qualified leads per month",
-                    "One SME increased revenue by £180k in their first year with us"
-                ]
-            }
-        }
+        """Binds the shared module-level frameworks and matchers.
 
-        # UK location-specific hooks and context
-        self.location_hooks = {
-            'london': {
-                'hook': "In a market as competitive as London",
-                'context': "London businesses",
-                'challenge': "standing out in the capital's crowded marketplace"
-            },
-            'birmingham': {
-                'hook': "In Birmingham's growing business ecosystem",
-                'context': "Birmingham businesses",
-                'challenge': "capturing market share in the Midlands' largest city"
-            },
-            'manchester': {
-                'hook': "In Manchester's competitive market",
-                'context': "Manchester businesses",
-                'challenge': "thriving in the Northwest's business hub"
-            },
-            'scotland': {
-                'hook': "In the Scottish market",
-                'context': "Scottish businesses",
-                'challenge': "growing your presence across Scotland"
-            },
-            'wales': {
-                'hook': "In the Welsh business community",
-                'context': "Welsh businesses",
-                'challenge': "expanding in the Welsh market"
-            },
-            'liverpool': {
-                'hook': "In Liverpool's vibrant business scene",
-                'context': "Liverpool businesses",
-                'challenge': "standing out in Merseyside"
-            },
-            'leeds': {
-                'hook': "In Leeds' competitive environment",
-                'context': "Leeds businesses",
-                'challenge': "growing in Yorkshire's business capital"
-            },
-            'default': {
-                'hook': "In your local market",
-                'context': "local businesses",
-                'challenge': "standing out from your competition"
-            }
-        }
+        The framework data and its derived matchers are static, so they are
+        built once at import time above; instantiation only wires references.
+        """
+        self.industry_patterns = _INDUSTRY_PATTERNS
+        self.location_hooks = _LOCATION_HOOKS
+        self.spin_framework = _SPIN_FRAMEWORK
+        self.influence_principles = _INFLUENCE_PRINCIPLES
+        self.objection_responses = _OBJECTION_RESPONSES
+        self._city_re = _CITY_RE
+        self._industry_names = _INDUSTRY_NAMES
+        self._industry_ids = _INDUSTRY_IDS
+        self._keyword_sets = _KEYWORD_SETS
+        self._pains = _PAINS
+        self._values = _VALUES
+        self._cases = _CASES
+        self._general_id = _GENERAL_ID
+        self._industry_master = _INDUSTRY_MASTER
+        self._industry_automaton = _INDUSTRY_AUTOMATON
+        # Hot-path shortcut: skips the spin_framework['need_payoff'] lookup
+        # on every generated email
+        self._need_payoff = _NEED_PAYOFF
 
-        # SPIN Framework questions
-        self.spin_framework = {
-            'situation': [
-                "How are you currently attracting new customers to {company_name}?",
-                "What's been your main source of new business over the past 6 months?",
-                "How much time do you spend on business development each week?",
-                "Who's responsible for bringing in new clients at {company_name}?"
-            ],
-            'problem': [
-                "Are you finding it challenging to generate consistent leads?",
-                "Is it getting harder to stand out from local competition?",
-                "Do you worry about feast-or-famine in your pipeline?",
-                "Are you relying too heavily on word-of-mouth alone?"
-            ],
-            'implication': [
-                "What happens to {company_name} if your main lead source dries up?",
-                "How much revenue are you leaving on the table with an inconsistent pipeline?",
-                "What's it costing you to turn away work because you're too busy, then go quiet?",
-                "How is unpredictable revenue affecting your ability to plan and invest?"
-            ],
-            'need_payoff': [
-                "How valuable would it be to have a predictable flow of qualified leads?",
-                "What would it mean for {company_name} to reduce customer acquisition costs by 40%?",
-                "How would your business transform with a full pipeline year-round?",
-                "What could you achieve if marketing became your competitive advantage?"
-            ]
-        }
-        
-        # Influence principles (Cialdini)
-        self.influence_principles = {
-            'social_proof': [
-                "We work with {number} other {industry} businesses in your area",
-                "{competitor_type} businesses are increasingly using this approach",
-                "This is becoming the standard for successful {industry} companies"
-            ],
-            'scarcity': [
-                "We only take on {number} new clients per quarter to maintain quality",
-                "We're booking consultations for {month} right now",
-                "This approach works best when implemented before your busy season"
-            ],
-            'authority': [
-                "We've generated over £{amount} in revenue for {industry} businesses",
-                "Our team has {number} years of experience in {industry} marketing",
-                "We've helped {number} businesses in your sector achieve {result}"
-            ],
-            'reciprocity': [
-                "I'd be happy to share our {industry} benchmark report with you",
-                "I can send you a quick analysis of your current online presence",
-                "Would a 15-minute marketing diagnostic be valuable?"
-            ]
-        }
+    def _identify_industry(self, company_name_lower: str) -> int:
+        """
+        Identifies the industry id of a company based on keywords in its
+        (already lowercased) name. Defaults to the 'general_business' id if
+        no specific industry is found.
+        """
+        if self._industry_automaton is not None:
+            # Single linear scan; keep only whole-word hits. Leftmost hit wins
+            # (smaller industry id breaks exact-position ties), matching the
+            # master regex's leftmost-occurrence semantics below.
+            best = None
+            for end_idx, (industry_id, kw) in self._industry_automaton.iter(company_name_lower):
+                start_idx = end_idx - len(kw) + 1
+                before_ok = start_idx == 0 or not company_name_lower[start_idx - 1].isalnum()
+                after_ok = end_idx == len(company_name_lower) - 1 or not company_name_lower[end_idx + 1].isalnum()
+                if before_ok and after_ok:
+                    candidate = (start_idx, industry_id)
+                    if best is None or candidate < best:
+                        best = candidate
+            return best[1] if best is not None else self._general_id
 
-        # Objection handling frameworks
-        self.objection_responses = {
-            'too_busy': {
-                'empathy': "I completely understand - that's exactly why this might be perfect timing.",
-                'reframe': "The businesses I work with were too busy to think about marketing... until their pipeline dried up.",
-                'close': "Can we schedule 15 minutes next week when you're less rushed?",
-                'alternative': "What if I sent you a 2-minute video explaining how this works, and you can watch it when convenient?"
-            },
-            'happy_with_current': {
-                'empathy': "That's great to hear - it sounds like things are working well right now.",
-                'reframe': "Can I ask - if what you're doing now suddenly stopped working tomorrow, what would be your backup plan?",
-                'insight': "That's the exact situation we help prevent. Even successful businesses benefit from diversifying their lead sources.",
-                'close': "Would it be worth a quick conversation just to explore what else might be possible?"
-            },
-            'too_expensive': {
-                'empathy': "I appreciate the concern about cost - that's always an important consideration.",
-                'reframe': "Here's what I've found: most {industry} businesses waste money on marketing that doesn't work. Our approach is about spending smarter, not more.",
-                'value': "Our clients typically see ROI within 90 days, and the cost is less than hiring one part-time person.",
-                'close': "Would you be open to a quick diagnostic to see where you might be leaving money on the table?"
-            },
-            'send_information': {
-                'empathy': "I could absolutely send information.",
-                'reframe': "But honestly, 90% of it won't apply to {company_name} specifically.",
-                'alternative': "What if we spent 15 minutes, I learn about your specific situation, and then I send you something actually relevant?",
-                'close': "Would Tuesday or Wednesday work better?"
-            }
-        }
+        m = self._industry_master.search(company_name_lower)
+        return self._industry_ids[m.lastgroup] if m else self._general_id
 
-    def _get_random_element(self, data_list: List[Any]) -> Optional[Any]:
-        """Safely gets a random element from a list."""
-        return random.choice(data_list) if data_list else None
+    def _identify_location_key(self, location_str: str) -> str:
+        """Identifies the location_hooks key for a location string.
 
-    def _identify_industry(self, company_name: str) -> str:
-        """
-        Identifies the industry of a company based on keywords in its name.
-        Defaults to 'general_business' if no specific industry is found.
+        The key is interned, so downstream dict lookups and the skeleton
+        cache's key comparison resolve on pointer equality.
         """
-        company_name_lower = company_name.lower()
-        for industry, data in self.industry_patterns.items():
-            if any(re.search(r'\b' + keyword + r'\b', company_name_lower) for keyword in data['keywords']):
-                return industry
-        return 'general_business'
+        m = self._city_re.search(_lower(location_str))
+        return sys.intern(m.group(0)) if m else 'default'
 
     def _identify_location_data(self, location_str: str) -> Dict[str, str]:
         """Identifies location-specific data based on a location string."""
-        location_lower = location_str.lower()
-        for city, data in self.location_hooks.items():
-            if city in location_lower:
-                return data
-        return self.location_hooks['default']
+        return self.location_hooks[self._identify_location_key(location_str)]
 
     def _get_ceo_first_name(self, lead: Lead) -> str:
-        """Extracts the first name from the CEO's full name."""
-        if not lead.ceo_name:
-            return ""
-        return lead.ceo_name.split()[0].strip()
+        """Returns the CEO first name (split once and cached on the Lead)."""
+        return lead.ceo_first
 
-    def _format_template(self, template: str, context: Dict[str, Any]) -> str:
-        """Formats a string template using a context dictionary."""
-        for key, value in context.items():
-            template = template.replace(f"{{{key}}}", str(value))
-        return template
+    @lru_cache(maxsize=None)
+    def _render_skeleton(self, industry_id: int, location_key: str,
+                         pain_idx: int, value_idx: int,
+                         case_idx: int, cta_idx: int) -> Tuple[string.Template, string.Template]:
+        """Renders the structural (body, cta) templates for one combination.
+
+        Everything here depends only on the key tuple, never on the lead, so
+        the result is memoized: across thousands of leads the same
+        (industry, location, random-pick) combinations recur constantly, and
+        repeat hits skip all the string assembly. The returned templates keep
+        {company_name} and {ceo_first_name} unresolved for the per-lead pass.
+        """
+        location_data = self.location_hooks[location_key]
+
+        structural = _SafeDict({
+            "industry": self._industry_names[industry_id].replace('_', ' '),
+            "location_hook": location_data['hook'],
+            "challenge": location_data['challenge'],
+            "pain_point": self._pains[industry_id][pain_idx],
+            "value_prop": self._values[industry_id][value_idx],
+            "case_study": self._cases[industry_id][case_idx],
+        })
+
+        body_tpl = _BODY_TMPL.format_map(structural)
+        cta_tpl = self._need_payoff[cta_idx]
+
+        # Hand back string.Templates: the {lead} placeholders are rewritten to
+        # $-form once per cached combination, and safe_substitute fills them
+        # with a single C call per lead (tolerating missing keys)
+        return (
+            string.Template(_BRACE_RE.sub(r'${\1}', body_tpl)),
+            string.Template(_BRACE_RE.sub(r'${\1}', cta_tpl)),
+        )
 
     def generate_email(self, lead: Lead) -> Dict[str, str]:
         """
@@ -402,48 +611,91 @@ class PsychologyOutreachSystem:
 
         Returns:
             A dictionary containing the components of the email:
-            'subject', 'greeting', 'body', and 'cta'.
+            'subject', 'greeting', 'body', and 'cta'. All values are plain
+            strings (pre-convert datetimes etc. here, so the campaigns export
+            never needs a per-object serializer fallback).
         """
-        industry_key = self._identify_industry(lead.company_name)
-        industry_data = self.industry_patterns[industry_key]
-        location_data = self._identify_location_data(lead.location)
+        industry_id = self._identify_industry(lead.name_lower)
+        location_key = self._identify_location_key(lead.location)
+        return self._assemble(lead, industry_id, location_key)
+
+    def _assemble(self, lead: Lead, industry_id: int, location_key: str) -> Dict[str, str]:
+        """Draws the random picks and renders the final email for one lead."""
         ceo_first_name = self._get_ceo_first_name(lead)
 
+        # Draw indices (cheap) rather than elements, so the expensive skeleton
+        # assembly can be memoized on the full key tuple
+        body_tpl, cta_tpl = self._render_skeleton(
+            industry_id, location_key,
+            self._rng.randrange(len(self._pains[industry_id])),
+            self._rng.randrange(len(self._values[industry_id])),
+            self._rng.randrange(len(self._cases[industry_id])),
+            self._rng.randrange(len(self._need_payoff)),
+        )
+
+        # Final per-lead pass: only the two lead-specific placeholders remain
         context = {
             "company_name": lead.company_name,
             "ceo_first_name": ceo_first_name,
-            "industry": industry_key.replace('_', ' '),
-            "location_hook": location_data['hook'],
-            "challenge": location_data['challenge'],
-            "pain_point": self._get_random_element(industry_data['pain_points']),
-            "value_prop": self._get_random_element(industry_data['value_props']),
-            "case_study": self._get_random_element(industry_data['case_studies']),
         }
 
-        # Select a random Need-Payoff question for the CTA
-        cta_question = self._get_random_element(self.spin_framework['need_payoff'])
-
-        # Build the email components
-        subject = f"Idea for {context['company_name']}"
-        greeting = f"Hi {context['ceo_first_name']}," if context['ceo_first_name'] else f"Hi {context['company_name']} team,"
-
-        body = (
-            f"Noticed {context['company_name']} and wanted to reach out. {context['location_hook']}, "
-            f"I imagine that {context['challenge']} is a constant focus.\n\n"
-            f"We often speak with {context['industry']} businesses facing challenges with {context['pain_point']}. "
-            f"This is an area we specialize in. For context, {context['value_prop']}.\n\n"
-            f"To give you a real-world example, {context['case_study']}."
-        )
-
-        cta = self._format_template(cta_question, context)
+        subject = f"Idea for {lead.company_name}"
+        greeting = f"Hi {ceo_first_name}," if ceo_first_name else f"Hi {lead.company_name} team,"
 
         return {
             "subject": subject,
             "greeting": greeting,
-            "body": body,
-            "cta": cta
+            "body": body_tpl.safe_substitute(context),
+            "cta": cta_tpl.safe_substitute(context),
         }
 
+    def generate_emails_batch(self, leads: List[Lead]) -> List[Dict[str, str]]:
+        """
+        Columnar batch variant of generate_email for large outreach runs.
+
+        Classification runs as one tight column pass per derived field
+        (industry ids, then location keys) before the per-lead assembly loop,
+        amortizing interpreter dispatch versus interleaving every step lead
+        by lead. Results come back in lead order.
+        """
+        if not leads:
+            return []
+        industry_ids = [self._identify_industry(lead.name_lower) for lead in leads]
+        location_keys = [self._identify_location_key(lead.location) for lead in leads]
+        return [
+            self._assemble(lead, industry_id, location_key)
+            for lead, industry_id, location_key in zip(leads, industry_ids, location_keys)
+        ]
+
+    def generate_emails_parallel(self, leads: List[Lead], workers: Optional[int] = None,
+                                 chunksize: int = 256) -> List[Dict[str, str]]:
+        """
+        Process-parallel batch generation for very large lead lists.
+
+        Pure-Python generation gets no thread-level speedup under the GIL, so
+        shard across processes instead. The frameworks and matchers are
+        module-level constants, so forked children share them copy-on-write
+        and each worker only builds the cheap reference-binding system once
+        (the initializer). Results come back in lead order.
+        """
+        if len(leads) <= chunksize:
+            # Not worth the process startup/pickling overhead
+            return self.generate_emails_batch(leads)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as ex:
+            return list(ex.map(_generate_one, leads, chunksize=chunksize))
+
+# Worker-side plumbing for generate_emails_parallel: map() targets must be
+# module-level to pickle, and each worker builds its (cheap) system once.
+_WORKER_SYSTEM: Optional[PsychologyOutreachSystem] = None
+
+def _init_worker():
+    global _WORKER_SYSTEM
+    _WORKER_SYSTEM = PsychologyOutreachSystem()
+
+def _generate_one(lead: Lead) -> Dict[str, str]:
+    return _WORKER_SYSTEM.generate_email(lead)
+
+
 if __name__ == '__main__':
     # This block demonstrates how to use the PsychologyOutreachSystem class.
     # It will only run when the script is executed directly.
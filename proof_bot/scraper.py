@@ -1,6 +1,12 @@
 import os
 import json
+import atexit
+import hashlib
 import logging
+import queue
+import shelve
+import time
+from logging.handlers import QueueHandler, QueueListener
 import re
 import asyncio
 import random
@@ -9,17 +15,139 @@ from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime
 from urllib.parse import urljoin, quote_plus, urlparse
 
-import requests
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from operator import attrgetter
+
+import httpx
+import lxml.html
+import pandas as pd
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext, TimeoutError as PlaywrightTimeoutError
 from email_validator import validate_email, EmailNotValidError
-from phonenumbers import parse, is_valid_number, format_number, PhoneNumberFormat
+from phonenumbers import parse, is_valid_number, format_number, PhoneNumberFormat, PhoneNumberMatcher
 import urllib.robotparser as robotparser
 
 from .config import BotConfig
-from .models import Lead
+from .models import Lead, _QUALITY_WEIGHTS
 from . import utils
 
+# Prefer the build-time compiled selector module (served from .pyc, no JSON
+# parse at startup); generated by scripts/compile_selectors.py.
+try:
+    from ._compiled_selectors import SELECTORS as _COMPILED_SELECTORS
+except ImportError:
+    _COMPILED_SELECTORS = {}
+
+
+# ---------------------------------------------------------------------------
+# Precompiled patterns: these all run per company/officer, so compile once at
+# import instead of paying re's parse+build (and cache lookups) on every call.
+# ---------------------------------------------------------------------------
+_SIC_RE = re.compile(r"\b(\d{5})\b")
+# Accounts/confirmation labels combined into one alternation each: a single
+# finditer pass collects next+last together, and the line anchors keep the
+# lazy date capture from stopping after one character.
+_ACCOUNTS_RE = re.compile(
+    r'Next accounts made up to\s*(?P<next>.+?)\s*(?:due by\s*(?P<due>.+?))?\s*$'
+    r'|Last accounts made up to\s*(?P<last>.+?)\s*$',
+    re.IGNORECASE | re.MULTILINE,
+)
+_CONF_RE = re.compile(
+    r'Next statement date\s*(?P<next>.+?)\s*(?:due by\s*(?P<due>.+?))?\s*$'
+    r'|Last statement dated\s*(?P<last>.+?)\s*$',
+    re.IGNORECASE | re.MULTILINE,
+)
+_COMPANY_NUM_PREFIX_RE = re.compile(r"Company number\s*", re.IGNORECASE)
+_COMPANY_URL_NUM_RE = re.compile(r'/company/([A-Za-z0-9]+)')
+_INC_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+_APPT_RE = re.compile(
+    r'(.+?)\s+\(?(?:Company number:\s*)?([A-Za-z0-9]{2,}\d{6,})\)?\s+Appointed on\s+(.+)',
+    re.IGNORECASE,
+)
+_APPT_COMPANY_RE = re.compile(r'(.+?)\s+\(?(?:Company number:\s*)?([A-Za-z0-9]{2,}\d{6,})\)?', re.IGNORECASE)
+_SAFE_FILENAME_RE = re.compile(r"[^a-zA-Z0-9._-]+")
+
+
+# Hosts that are never a company's own website (directories, socials, search
+# engines). Matched as dotted suffixes of the netloc — one frozenset probe per
+# label instead of a 16-way substring scan per candidate URL.
+_BAD_HOST_SUFFIXES = frozenset({
+    "find-and-update.company-information.service.gov.uk",
+    "companieshouse.gov.uk", "linkedin.com", "facebook.com",
+    "twitter.com", "x.com", "instagram.com", "glassdoor.com",
+    "yell.com", "maps.google.com", "maps.google.co.uk", "crunchbase.com",
+    "companycheck.co.uk", "opencorporates.com", "companiesintheuk.co.uk",
+    "bing.com", "duckduckgo.com",
+})
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """Memoized lowercase netloc: the same lead.website strings get host-checked
+    repeatedly across enrichment, screenshots, and candidate cleaning."""
+    return urlparse(url).netloc.lower()
+
+
+def _is_bad_host(netloc: str) -> bool:
+    host = netloc.lower().rsplit('@', 1)[-1].split(':', 1)[0]
+    parts = host.split('.')
+    return any('.'.join(parts[i:]) in _BAD_HOST_SUFFIXES for i in range(len(parts)))
+
+
+@lru_cache(maxsize=256)
+def _css(selector: str) -> soupsieve.SoupSieve:
+    """Cached CSS-selector compilation for BeautifulSoup queries.
+
+    soupsieve re-parses the selector string on every soup.select() call;
+    caching the compiled SoupSieve pays off in the per-row listing loops.
+    """
+    return soupsieve.compile(selector)
+
+
+# Pain-point heuristics keyed by SIC code; first matching code wins, checked
+# in this order.
+_PAIN_POINTS_BY_SIC = (
+    ("73110", ("Lead generation efficiency", "Attribution/ROI visibility",
+               "Scaling paid media profitably")),
+    ("62012", ("Technical debt management", "Scalability issues",
+               "Talent acquisition challenges")),
+)
+
+
+def _score_batch(rows: List[tuple], target_sics: frozenset,
+                 target_location_lc: str) -> List[tuple]:
+    """Pure CPU scoring pass over a batch of enriched leads.
+
+    Runs inside ProcessPoolExecutor workers, so it only sees plain data:
+    each row is (icp, sic_text, address, officer_roles, quality_flags) and
+    each result is (icp, pain_points, quality_score, keep). Keeping all
+    scraper state out of the function is what makes it picklable and lets
+    the batch be split across workers.
+    """
+    out = []
+    for icp, sic_text, address, officer_roles, quality_flags in rows:
+        codes = _SIC_RE.findall(sic_text or "")
+        sic_match = not target_sics or not target_sics.isdisjoint(codes)
+        if not icp:
+            industry = 1.0 if sic_match else 0.0
+            geo = 1.0 if (not target_location_lc
+                          or target_location_lc in (address or "").lower()) else 0.0
+            icp = round(0.7 * industry + 0.3 * geo, 2)
+        # Boost if a senior officer is present, indicating high data value
+        if any(r in ('director', 'ceo', 'managing director') for r in officer_roles):
+            icp = min(1.0, icp + 0.20)
+        pain_points: List[str] = []
+        for sic, points in _PAIN_POINTS_BY_SIC:
+            if sic in codes:
+                pain_points = list(points)
+                break
+        quality = float(sum(
+            w for flag, (_, w) in zip(quality_flags, _QUALITY_WEIGHTS) if flag
+        ))
+        out.append((icp, pain_points, quality, sic_match))
+    return out
+
 
 # ---------------------------------------------------------------------------
 # Logging configuration
@@ -28,11 +156,17 @@ logger = logging.getLogger('ProofBot.Scraper')
 
 url_logger = logging.getLogger('VisitedUrls')
 if not url_logger.handlers:
-    # Ensure log directory exists if handler were to use an absolute path
-    # For simplicity, keeping it relative as in the original code.
-    handler = logging.FileHandler('visited_urls.log', 'w')
-    handler.setFormatter(logging.Formatter('%(message)s'))
-    url_logger.addHandler(handler)
+    # URL logging is per-request hot-path inside async code: QueueHandler
+    # turns each url_logger.info() into a plain enqueue, and a background
+    # QueueListener thread does the formatting and write syscalls off the
+    # event loop. Mode 'a' keeps prior runs instead of truncating on import.
+    _url_file_handler = logging.FileHandler('visited_urls.log', 'a')
+    _url_file_handler.setFormatter(logging.Formatter('%(message)s'))
+    _url_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _url_listener = QueueListener(_url_queue, _url_file_handler)
+    _url_listener.start()
+    atexit.register(_url_listener.stop)  # stop() drains remaining records
+    url_logger.addHandler(QueueHandler(_url_queue))
     url_logger.setLevel(logging.INFO)
 
 
@@ -44,25 +178,104 @@ class EliteWebScraper:
 
     def __init__(self, config: BotConfig):
         self.config = config
-        self.session = self._create_session()
+        self.client = self._create_client()
         self.rate_limiter = utils.DomainRateLimiter(min_delay_s=config.request_delay)
+        # robots.txt parsers cached per scheme://netloc with a fetch timestamp;
+        # re-read only after _ROBOTS_TTL_S instead of once per checked URL
+        self._robots_cache: Dict[str, Tuple[float, robotparser.RobotFileParser]] = {}
         self.selectors = self._load_selectors()
-        self.target_sic_codes = self.config.sic_codes  # Use the sic_codes from config
+        # Compile the generic-website email pattern once at selector load
+        # (it runs against every fetched page in _harvest_contacts_from_html).
+        # re.ASCII: email tokens are ASCII, and it keeps \w/\b from paying
+        # the Unicode property lookups on large HTML strings. Phones use
+        # phonenumbers.PhoneNumberMatcher instead of the old pattern list.
+        gw = self.selectors.get("generic_website", {})
+        self._email_regex = re.compile(gw["email_pattern"], re.ASCII) if gw.get("email_pattern") else None
+        # Target-SIC snapshot, frozen instead of rebuilt per _sic_matches_target
+        # call. Initialized here for direct method use, but re-derived at
+        # run_scraper() start: apply_smart_selection() rebinds config.sic_codes
+        # after the scraper is constructed.
+        self.target_sic_codes = self.config.sic_codes
+        self._target_sic_set = frozenset(self.target_sic_codes or [])
+        # Normalized once instead of .strip().lower() per address/row check;
+        # likewise re-derived at run_scraper() start since smart selection may
+        # rebind config.target_location too.
+        self._target_location_lc = (self.config.target_location or "").strip().lower()
+        # On-disk memo for search-engine lookups: duplicate company names
+        # and warm re-runs answer from cache instead of re-hitting Bing/DDG
+        self._search_cache = self._open_search_cache()
+        # Warm BrowserContext pool for company-profile scraping (built lazily
+        # once a Browser exists); stealth script contents cached alongside so
+        # the file is read once per run, not once per page
+        self._ctx_pool: Optional[asyncio.Queue] = None
+        self._stealth_js: Optional[str] = None
+        # Process pool for the phase-2 batch scoring pass; built lazily so
+        # short runs that never reach scoring don't fork workers
+        self._cpu_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._load_stealth_js()  # one disk read at init, not inside the async path
         logger.info("EliteWebScraper initialized.")
         url_logger.info(f"# Run started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
     # -----------------------------------------------------------------------
     # Utilities
     # -----------------------------------------------------------------------
-    def _create_session(self) -> requests.Session:
-        s = requests.Session()
-        s.headers.update({
-            'User-Agent': utils.choose_user_agent(),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-GB,en;q=0.5',
-        })
-        s.timeout = 15
-        return s
+    def _create_client(self) -> httpx.AsyncClient:
+        # Async HTTP/2 client shared for the scraper's lifetime: keep-alive
+        # pooling reuses TCP+TLS handshakes across requests, and async calls
+        # no longer block the event loop the way requests.Session.get did.
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            headers={
+                'User-Agent': utils.choose_user_agent(),
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'en-GB,en;q=0.5',
+            },
+            timeout=15.0,
+            follow_redirects=True,
+        )
+
+    async def aclose(self):
+        """Shutdown hook: drain the HTTP connection pool."""
+        await self.client.aclose()
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+            self._cpu_pool = None
+        if self._search_cache is not None:
+            try:
+                self._search_cache.close()
+            except Exception as e:
+                logger.debug(f"Error closing search cache: {e}")
+
+    _SEARCH_CACHE_PATH = "cache/search_cache"
+
+    def _open_search_cache(self) -> Optional[shelve.Shelf]:
+        try:
+            os.makedirs(os.path.dirname(self._SEARCH_CACHE_PATH), exist_ok=True)
+            return shelve.open(self._SEARCH_CACHE_PATH)
+        except Exception as e:
+            logger.debug(f"Search cache unavailable ({e}); proceeding without.")
+            return None
+
+    @staticmethod
+    def _search_cache_key(*parts: Optional[str]) -> str:
+        return hashlib.sha1("|".join(p or "" for p in parts).encode()).hexdigest()
+
+    def _search_cache_get(self, key: str) -> Tuple[bool, Optional[str]]:
+        if self._search_cache is not None:
+            try:
+                if key in self._search_cache:
+                    return True, self._search_cache[key]
+            except Exception as e:
+                logger.debug(f"Search cache read failed: {e}")
+        return False, None
+
+    def _search_cache_put(self, key: str, value: Optional[str]) -> None:
+        if self._search_cache is not None:
+            try:
+                self._search_cache[key] = value
+            except Exception as e:
+                logger.debug(f"Search cache write failed: {e}")
 
     def _merge_selectors(self, loaded: Dict, default: Dict) -> Dict:
         """Recursively merge loaded selectors with defaults, prioritizing loaded."""
@@ -83,6 +296,10 @@ class EliteWebScraper:
         return merged
 
     def _load_selectors(self) -> Dict:
+        compiled = _COMPILED_SELECTORS.get(self.config.selectors_file)
+        if compiled is not None:
+            logger.info(f"Loaded precompiled selectors for {self.config.selectors_file}")
+            return self._merge_selectors(compiled, self._default_selectors())
         try:
             with open(self.config.selectors_file, 'r') as f:
                 data = json.load(f)
@@ -162,38 +379,139 @@ class EliteWebScraper:
             },
         }
 
-    async def _inject_stealth(self, page: Page):
-        # Assuming 'stealth.js' is in the same directory as this file or accessible via the path logic
-        path = os.path.join(os.path.dirname(__file__), 'stealth.js')
+    def _load_stealth_js(self) -> Optional[str]:
+        if self._stealth_js is None:
+            # Assuming 'stealth.js' is in the same directory as this file
+            path = os.path.join(os.path.dirname(__file__), 'stealth.js')
+            try:
+                with open(path, 'r') as f:
+                    self._stealth_js = f.read()
+            except Exception as e:
+                logger.warning(f"Could not load stealth script: {e}")
+                self._stealth_js = ""
+        return self._stealth_js or None
+
+    async def _prime_context(self, context: BrowserContext):
+        """Registers the stealth init-script on a context, once.
+
+        Context-level registration applies to every page the context opens,
+        replacing the old per-page add_init_script (file IO + parse per page).
+        """
+        js = self._load_stealth_js()
+        if js:
+            try:
+                await context.add_init_script(js)
+                logger.debug("Primed context with stealth script.")
+            except Exception as e:
+                logger.warning(f"Could not prime context with stealth script: {e}")
+
+    # Resource types aborted on scraping contexts: none of them contribute to
+    # the text/DOM we extract, and dropping them cuts most of the bytes per
+    # page load. Screenshot contexts are exempt (a faithful render needs them).
+    _BLOCKED_RESOURCE_TYPES = ("image", "font", "media", "stylesheet")
+
+    async def _block_heavy_resources(self, context: BrowserContext):
+        """Registers a route that aborts image/font/media/stylesheet loads."""
+        blocked = self._BLOCKED_RESOURCE_TYPES
+
+        async def _route(route):
+            if route.request.resource_type in blocked:
+                await route.abort()
+            else:
+                await route.continue_()
+
+        try:
+            await context.route("**/*", _route)
+        except Exception as e:
+            logger.warning(f"Could not register resource-blocking route: {e}")
+
+    def _proxy_dict(self) -> Optional[Dict[str, str]]:
+        if self.config.use_proxies and self.config.proxy_pool:
+            return {'server': random.choice(self.config.proxy_pool)}
+        return None
+
+    def _storage_state(self) -> Optional[str]:
+        """Path to the persisted storage_state dump from a previous run, if any.
+
+        Seeding new contexts with it carries consent/session cookies across
+        runs, so cookie banners short-circuit instead of costing a click and
+        a navigation wait per domain.
+        """
+        path = self.config.browser_state_file
+        return path if path and os.path.exists(path) else None
+
+    async def _save_storage_state(self, context: BrowserContext):
+        """Persist the context's cookies/localStorage for the next run."""
+        if not self.config.browser_state_file:
+            return
         try:
-            with open(path, 'r') as f:
-                await page.add_init_script(f.read())
-            logger.debug("Injected stealth script.")
+            await context.storage_state(path=self.config.browser_state_file)
+            logger.debug(f"Saved browser storage state to {self.config.browser_state_file}")
         except Exception as e:
-            logger.warning(f"Could not inject stealth script: {e}")
+            logger.debug(f"Could not save browser storage state: {e}")
+
+    async def _ensure_ctx_pool(self, browser: Browser):
+        """Pre-creates a bounded pool of warm, stealth-primed contexts."""
+        if self._ctx_pool is not None:
+            return
+        pool: asyncio.Queue = asyncio.Queue()
+        for _ in range(max(1, self.config.max_workers)):
+            ctx = await utils.new_context_with_profile(
+                browser, proxy=self._proxy_dict(), storage_state=self._storage_state()
+            )
+            await self._prime_context(ctx)
+            await self._block_heavy_resources(ctx)
+            pool.put_nowait(ctx)
+        self._ctx_pool = pool
+        logger.info(f"Browser context pool ready ({pool.qsize()} contexts).")
+
+    async def _close_ctx_pool(self):
+        if self._ctx_pool is None:
+            return
+        saved = False
+        while not self._ctx_pool.empty():
+            try:
+                ctx = self._ctx_pool.get_nowait()
+                if not saved:
+                    # Dump one context's cookies so the next run starts warm
+                    await self._save_storage_state(ctx)
+                    saved = True
+                await ctx.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled context: {e}")
+        self._ctx_pool = None
 
     def _normalize(self, s: Optional[str]) -> str:
         return (s or "").strip()
 
     def _address_matches(self, address: str) -> bool:
-        loc = (self.config.target_location or "").strip().lower()
-        if not loc:
+        if not self._target_location_lc:
             return True
-        return loc in (address or "").strip().lower()
+        return self._target_location_lc in (address or "").lower()
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_sic_codes_list(sic_text: str) -> Tuple[str, ...]:
+        """Extract 5-digit SIC codes from a blob of text.
 
-    def _extract_sic_codes_list(self, sic_text: str) -> List[str]:
-        """Extract list of 5-digit SIC codes from a blob of text."""
+        Pure function of the text, so memoized: the same SIC strings recur
+        across the overview scrape, the target filter, and the ICP score.
+        Returns a tuple (hashable, safely shareable across cache hits).
+        """
         if not sic_text or sic_text == "Unknown":
-            return []
-        codes = re.findall(r"\b(\d{5})\b", sic_text)
-        return list(dict.fromkeys(codes))  # de-dupe, keep order
+            return ()
+        seen = set()
+        codes = []
+        for code in _SIC_RE.findall(sic_text):
+            if code not in seen:  # de-dupe in one pass, keep order
+                seen.add(code)
+                codes.append(code)
+        return tuple(codes)
 
     def _sic_matches_target(self, sic_text: str) -> bool:
-        target = set(self.target_sic_codes or [])
-        if not target:
+        if not self._target_sic_set:
             return True
-        codes = set(self._extract_sic_codes_list(sic_text))
-        return not target.isdisjoint(codes)
+        return not self._target_sic_set.isdisjoint(self._extract_sic_codes_list(sic_text))
 
     def _compute_icp_score(self, sic_text: str, address: str) -> float:
         industry_match = 1.0 if self._sic_matches_target(sic_text) else 0.0
@@ -201,16 +519,32 @@ class EliteWebScraper:
         # Simple weighted score; adjust as needed
         return round(0.7 * industry_match + 0.3 * geo_match, 2)
 
-    def _respect_robots_allowed(self, url: str) -> bool:
+    _ROBOTS_TTL_S = 3600.0
+
+    async def _respect_robots_allowed(self, url: str) -> bool:
         if not getattr(self.config, "respect_robots", False):
             return True
         try:
             parsed = urlparse(url)
-            robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-            rp = robotparser.RobotFileParser()
-            rp.set_url(robots_url)
-            rp.read()
-            ua = self.session.headers.get("User-Agent", "*")
+            netloc_key = f"{parsed.scheme}://{parsed.netloc}"
+            now = time.time()
+            cached = self._robots_cache.get(netloc_key)
+            if cached and now - cached[0] <= self._ROBOTS_TTL_S:
+                rp = cached[1]
+            else:
+                # One robots.txt fetch per host per TTL window, through the
+                # shared pooled client instead of RobotFileParser's blocking
+                # urllib read
+                rp = robotparser.RobotFileParser()
+                resp = await self.client.get(f"{netloc_key}/robots.txt")
+                if resp.status_code in (401, 403):
+                    rp.disallow_all = True
+                elif resp.status_code >= 400:
+                    rp.allow_all = True
+                else:
+                    rp.parse(resp.text.splitlines())
+                self._robots_cache[netloc_key] = (now, rp)
+            ua = self.client.headers.get("User-Agent", "*")
             return rp.can_fetch(ua, url)
         except Exception:
             # Fail open to avoid blocking entire pipeline; log only
@@ -231,6 +565,35 @@ class EliteWebScraper:
             logger.debug(f"Error extracting '{dt_text}': {e}")
             return "Unknown"
 
+    async def _extract_all_fields(self, page: Page, labels: List[str]) -> Dict[str, str]:
+        """Extract the dd text for several dt labels in one in-page pass.
+
+        A single page.evaluate walks every dt/dd pair in the document instead
+        of paying two CDP round-trips (count + inner_text) per label. Missing
+        labels come back as "Unknown", matching _extract_field.
+        """
+        try:
+            found = await page.evaluate(
+                """(labels) => {
+                    const out = {};
+                    for (const dt of document.querySelectorAll('dt')) {
+                        const t = dt.textContent.trim();
+                        for (const label of labels) {
+                            if (!(label in out) && t.includes(label)) {
+                                out[label] = (dt.nextElementSibling?.innerText || '').trim();
+                                break;
+                            }
+                        }
+                    }
+                    return out;
+                }""",
+                labels,
+            )
+        except Exception as e:
+            logger.debug(f"Batch dt/dd extraction failed on {page.url}: {e}")
+            found = {}
+        return {label: (found.get(label) or "Unknown") for label in labels}
+
     async def _extract_sic(self, page: Page) -> str:
         """Extract SIC codes, robustly using configured selectors or fallback."""
         sic_codes_text_parts = []
@@ -245,7 +608,7 @@ class EliteWebScraper:
                     elements = await page.locator(sel).all()
                     for el in elements:
                         text = await el.inner_text()
-                        if re.search(r'\b\d{5}\b', text): # Only add text that seems to contain a 5-digit code
+                        if _SIC_RE.search(text): # Only add text that seems to contain a 5-digit code
                             sic_codes_text_parts.append(text)
                     if sic_codes_text_parts: # If we found something with this selector, break and process
                         break # Found codes, no need to try other selectors
@@ -262,7 +625,7 @@ class EliteWebScraper:
                 if await dt_locator.count() > 0:
                     dd_locator = dt_locator.locator("+ dd")
                     dd_text = await dd_locator.inner_text()
-                    if re.search(r'\b\d{5}\b', dd_text): # Check if dd_text contains SIC codes
+                    if _SIC_RE.search(dd_text): # Check if dd_text contains SIC codes
                         sic_codes_text_parts.append(dd_text)
             except Exception as e:
                 logger.debug(f"Fallback dt+dd SIC extraction error: {e}")
@@ -283,16 +646,14 @@ class EliteWebScraper:
         accounts_next = "Unknown"
         accounts_last = "Unknown"
         if accounts_text and accounts_text != "Unknown":
-            # Next accounts made up to 31 July 2025 due by 30 April 2026
-            next_match = re.search(r'Next accounts made up to\s*(.+?)\s*(?:due by\s*(.+))?', accounts_text, re.IGNORECASE)
-            if next_match:
-                made_up_to = (next_match.group(1) or "").strip()
-                due_by = (next_match.group(2) or "").strip()
-                accounts_next = f"{made_up_to}{' due by ' + due_by if due_by else ''}".strip()
-            # Last accounts made up to 31 July 2024
-            last_match = re.search(r'Last accounts made up to\s*(.+)', accounts_text, re.IGNORECASE)
-            if last_match:
-                accounts_last = (last_match.group(1) or "").strip()
+            # e.g. "Next accounts made up to 31 July 2025 due by 30 April 2026"
+            #      "Last accounts made up to 31 July 2024"
+            for m in _ACCOUNTS_RE.finditer(accounts_text):
+                if m.group('next') is not None:
+                    due_by = (m.group('due') or "").strip()
+                    accounts_next = f"{m.group('next').strip()}{' due by ' + due_by if due_by else ''}".strip()
+                elif m.group('last') is not None:
+                    accounts_last = m.group('last').strip()
         return accounts_next, accounts_last
 
     async def _parse_confirmation(self, conf_text: str) -> Tuple[str, str]:
@@ -300,16 +661,14 @@ class EliteWebScraper:
         conf_next = "Unknown"
         conf_last = "Unknown"
         if conf_text and conf_text != "Unknown":
-            # Next statement date 5 July 2026 due by 19 July 2026
-            next_match = re.search(r'Next statement date\s*(.+?)\s*(?:due by\s*(.+))?', conf_text, re.IGNORECASE)
-            if next_match:
-                date = (next_match.group(1) or "").strip()
-                due_by = (next_match.group(2) or "").strip()
-                conf_next = f"{date}{' due by ' + due_by if due_by else ''}".strip()
-            # Last statement dated 5 July 2025
-            last_match = re.search(r'Last statement dated\s*(.+)', conf_text, re.IGNORECASE)
-            if last_match:
-                conf_last = (last_match.group(1) or "").strip()
+            # e.g. "Next statement date 5 July 2026 due by 19 July 2026"
+            #      "Last statement dated 5 July 2025"
+            for m in _CONF_RE.finditer(conf_text):
+                if m.group('next') is not None:
+                    due_by = (m.group('due') or "").strip()
+                    conf_next = f"{m.group('next').strip()}{' due by ' + due_by if due_by else ''}".strip()
+                elif m.group('last') is not None:
+                    conf_last = m.group('last').strip()
         return conf_next, conf_last
 
     def _build_target_queries(self) -> List[str]:
@@ -332,29 +691,74 @@ class EliteWebScraper:
                 "digital marketing agency",
                 "advertising agency",
             ])
-        # De-dup, keep order
-        queries = list(dict.fromkeys([s for s in seeds if s]))
+        # De-dup in one pass, keep order
+        seen = set()
+        queries = []
+        for s in seeds:
+            if s and s not in seen:
+                seen.add(s)
+                queries.append(s)
         logger.info(f"Target queries for Companies House: {queries}")
         return queries
 
     async def _collect_company_links_from_search(self, page: Page) -> List[str]:
         """Collect company profile links from a CH search results page."""
-        # Be robust to layout: collect any anchor to /company/<number>
+        # Be robust to layout: collect any anchor to /company/<number>.
+        # A single page.evaluate returns only the hrefs we want (a few hundred
+        # bytes) instead of shipping the whole serialized page over CDP just
+        # to parse most of it away.
         links = []
+        seen = set()
         try:
-            # Using a more specific selector from CH results page structure
-            anchors = await page.locator("a.govuk-link[href*='/company/']").all()
-            for a in anchors:
-                href = await a.get_attribute("href")
-                # Filter for actual company profile links
+            hrefs = await page.evaluate(
+                """() => Array.from(
+                    document.querySelectorAll("a.govuk-link[href*='/company/']"),
+                    a => a.getAttribute('href')
+                )"""
+            )
+            for href in hrefs:
+                # Filter for actual company profile links, de-duping as we go
                 if href and "/company/" in href and not href.endswith("/filing-history"):
-                    links.append(urljoin(page.url, href))
+                    link = urljoin(page.url, href)
+                    if link not in seen:
+                        seen.add(link)
+                        links.append(link)
         except Exception as e:
             logger.debug(f"Error collecting company links: {e}")
-        # De-dup while preserving order
-        links = list(dict.fromkeys(links))
         return links
 
+    async def _detect_search_page_count(self, page: Page) -> int:
+        """Read the paginator's deepest page number in one evaluate (1 if absent)."""
+        try:
+            n = await page.evaluate(
+                """() => {
+                    const ns = Array.from(
+                        document.querySelectorAll('.govuk-pagination__item a, ul.pager li a'),
+                        a => parseInt(a.textContent.trim(), 10)
+                    ).filter(Number.isFinite);
+                    return ns.length ? Math.max(...ns) : 1;
+                }"""
+            )
+            return max(1, int(n))
+        except Exception as e:
+            logger.debug(f"Could not detect search page count: {e}")
+            return 1
+
+    async def _collect_links_from_numbered_page(self, base_search_url: str, page_num: int) -> List[str]:
+        """Load one numbered search-results page in a pooled context and collect links."""
+        context = await self._ctx_pool.get()
+        page = await context.new_page()
+        try:
+            url = f"{base_search_url}&page={page_num}"
+            await utils.polite_goto(page, url, logger=logger, limiter=self.rate_limiter)
+            return await self._collect_company_links_from_search(page)
+        except Exception as e:
+            logger.debug(f"Failed to fetch search page {page_num}: {e}")
+            return []
+        finally:
+            await page.close()
+            self._ctx_pool.put_nowait(context)
+
     # -----------------------------------------------------------------------
     # Simple directory scraper (example: Clutch)
     # -----------------------------------------------------------------------
@@ -374,16 +778,28 @@ class EliteWebScraper:
                 await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
                 await asyncio.sleep(random.uniform(2.0, 3.0))
 
-            soup = BeautifulSoup(await page.content(), "html.parser")
-            
-            # Select the main listing elements
-            list_elements = soup.select(src["selectors"]["agency_list"])
-            
+            # lxml parses far faster than html.parser, and a SoupStrainer
+            # scoped to the listing rows skips building the rest of the tree.
+            # Derive the strainer from the configured list selector when it is
+            # a simple tag.class pattern; otherwise parse the full document.
+            strainer = None
+            list_sel = src["selectors"]["agency_list"]
+            simple = re.fullmatch(r'(\w+)\.([\w-]+)', list_sel)
+            if simple:
+                strainer = SoupStrainer(simple.group(1), class_=simple.group(2))
+            soup = BeautifulSoup(await page.content(), "lxml", parse_only=strainer)
+
+            # Select the main listing elements (compiled selectors via _css)
+            list_elements = _css(src["selectors"]["agency_list"]).select(soup)
+
+            name_css = _css(src["selectors"]["company_name"])
+            site_css = _css(src["selectors"]["website_link"])
+            loc_css = _css(src["selectors"]["location"])
             for a in list_elements[: self.config.target_count]:
-                name_el = a.select_one(src["selectors"]["company_name"])
+                name_el = name_css.select_one(a)
                 # Website link can be in a data attribute or href, checking for common pattern
-                site_el = a.select_one(src["selectors"]["website_link"])
-                loc_el = a.select_one(src["selectors"]["location"])
+                site_el = site_css.select_one(a)
+                loc_el = loc_css.select_one(a)
 
                 name = name_el.get_text(strip=True) if name_el else "Unknown"
                 website = site_el.get("href") if site_el else None
@@ -392,7 +808,7 @@ class EliteWebScraper:
                 # Simple filtering checks
                 if not website:
                     continue
-                if self.config.target_location and self.config.target_location.lower() not in (loc or "").lower():
+                if self._target_location_lc and self._target_location_lc not in (loc or "").lower():
                     continue
 
                 leads.append(
@@ -404,20 +820,46 @@ class EliteWebScraper:
             logger.error(f"Error scraping Clutch: {e}", exc_info=True)
         return leads
 
+    async def _scrape_profiles_batch(self, company_urls: List[str], leads: List[Lead]) -> None:
+        """Scrape a page's worth of company profiles concurrently.
+
+        Runs waves of profile_concurrency profiles at a time, so a wave's
+        wall time is the slowest company rather than the sum. Each in-flight
+        profile still needs a pooled context, so effective parallelism is
+        min(profile_concurrency, max_workers); the DomainRateLimiter spaces
+        requests per host, and scraping stops once the global target count is
+        reached (at most one wave of overshoot).
+        """
+        width = max(1, self.config.profile_concurrency)
+        i = 0
+        while i < len(company_urls) and len(leads) < self.config.target_count:
+            batch = company_urls[i:i + width]
+            i += width
+            results = await asyncio.gather(
+                *(self._scrape_single_company_profile(u) for u in batch),
+                return_exceptions=True,
+            )
+            for res in results:
+                if isinstance(res, BaseException):
+                    logger.error(f"Company profile scrape failed: {res}")
+                elif res and len(leads) < self.config.target_count:
+                    leads.append(res)
+
     # -----------------------------------------------------------------------
     # Companies House Helper: Scrape Single Company Profile
     # -----------------------------------------------------------------------
-    async def _scrape_single_company_profile(self, company_url: str, context: BrowserContext) -> Optional[Lead]:
+    async def _scrape_single_company_profile(self, company_url: str) -> Optional[Lead]:
         """
         Navigates to a single Companies House company profile URL, scrapes all details
-        including officers, and returns a Lead object.
+        including officers, and returns a Lead object. Acquires a warm,
+        stealth-primed context from the pool for the duration of the company.
         """
         key = "companies_house"
         sel = self.selectors["sources"][key]
         num = "Unknown"  # Initialize num
 
+        context = await self._ctx_pool.get()
         company_page = await context.new_page()
-        await self._inject_stealth(company_page)
 
         try:
             logger.info(f"Scraping company profile: {company_url}")
@@ -432,26 +874,34 @@ class EliteWebScraper:
             num_raw_locator = company_page.locator("p#company-number")
             if await num_raw_locator.count() > 0:
                 num_raw = await num_raw_locator.inner_text()
-                num = re.sub(r"Company number\s*", "", num_raw, flags=re.IGNORECASE).strip()
+                num = _COMPANY_NUM_PREFIX_RE.sub("", num_raw).strip()
             else:
-                match_num_from_url = re.search(r'/company/([A-Za-z0-9]+)', company_url)
+                match_num_from_url = _COMPANY_URL_NUM_RE.search(company_url)
                 if match_num_from_url:
                     num = match_num_from_url.group(1)
                 else:
                     num = "Unknown"
 
-            address = await self._extract_field(company_page, "Registered office address")
-            c_status = await self._extract_field(company_page, "Company status")
-            c_type = await self._extract_field(company_page, "Company type")
-            inc_date = await self._extract_field(company_page, "Incorporated on")
-            accounts_text = await self._extract_field(company_page, "Accounts")
-            conf_text = await self._extract_field(company_page, "Confirmation statement")
-            sic = await self._extract_sic(company_page)
-
-            # Pre-filter checks (redundant if main loop filters, but good for isolated calls)
+            fields = await self._extract_all_fields(company_page, [
+                "Registered office address", "Company status", "Company type",
+                "Incorporated on", "Accounts", "Confirmation statement",
+            ])
+            address = fields["Registered office address"]
+            c_status = fields["Company status"]
+            c_type = fields["Company type"]
+            inc_date = fields["Incorporated on"]
+            accounts_text = fields["Accounts"]
+            conf_text = fields["Confirmation statement"]
+
+            # Pre-filter checks (redundant if main loop filters, but good for
+            # isolated calls). Gate on status first: it is already in hand from
+            # the batched field grab, so dissolved/dormant companies never pay
+            # for the multi-query SIC extraction below.
             if "active" not in (c_status or "").lower():
                 logger.debug(f"Skipping {name} due to status: {c_status}")
                 return None
+
+            sic = await self._extract_sic(company_page)
             if not self._sic_matches_target(sic):
                 logger.debug(f"Skipping {name} due to SIC: {sic}")
                 return None
@@ -473,7 +923,7 @@ class EliteWebScraper:
             lead.status = c_status
             lead.company_type = c_type
             lead.incorporation_date = inc_date
-            match = re.search(r"\b(19|20)\d{2}\b", inc_date or "")
+            match = _INC_YEAR_RE.search(inc_date or "")
             lead.founded_year = match[0] if match else None
             lead.sic_codes = sic
             lead.accounts_next = accounts_next
@@ -486,101 +936,52 @@ class EliteWebScraper:
                 people_tab_locator = company_page.locator(sel['company_overview_page']['people_tab_link'])
                 if await people_tab_locator.count() > 0 and await people_tab_locator.is_enabled(timeout=5000):
                     await people_tab_locator.click()
-                    await company_page.wait_for_load_state("networkidle", timeout=30000)
+                    # Officer cards are server-rendered; domcontentloaded is
+                    # enough and skips waiting out analytics/beacon traffic
+                    await company_page.wait_for_load_state("domcontentloaded", timeout=20000)
                     await asyncio.sleep(random.uniform(1.0, 2.0))
 
-                    cards = await company_page.locator(sel['officers_page']['officer_cards']).all()
+                    # Parse all officer cards out of one page.content() snapshot
+                    # with lxml instead of several locator round-trips per card
+                    root = lxml.html.fromstring(await company_page.content())
+                    cards = root.xpath(
+                        "//*[contains(concat(' ', normalize-space(@class), ' '), ' appointment-block ')]"
+                    )
+                    pending: List[Tuple[Dict[str, Any], str]] = []
+                    active_text = sel['officers_page']['active_role_text'].lower()
                     for card in cards:
                         try:
-                            status_span_locator = card.locator(sel['officers_page']['officer_role_status'])
-                            status_span = (await status_span_locator.inner_text()).strip() if await status_span_locator.count() else ""
-                            if sel['officers_page']['active_role_text'].lower() not in status_span.lower():
+                            status_spans = card.xpath(".//span[starts-with(@id,'officer-status-tag-')]")
+                            status_span = status_spans[0].text_content().strip() if status_spans else ""
+                            if active_text not in status_span.lower():
                                 continue
-                                
-                            name_loc = card.locator(sel['officers_page']['officer_name_link']).first
-                            officer_name = (await name_loc.inner_text()).strip() if await name_loc.count() else "Unknown"
-                            officer_href = await name_loc.get_attribute('href') if await name_loc.count() else None
-                            
+
+                            name_links = card.xpath(".//a[contains(@class,'govuk-link') and contains(@href,'/officers/')]")
+                            officer_name = name_links[0].text_content().strip() if name_links else "Unknown"
+                            officer_href = name_links[0].get('href') if name_links else None
+
                             role_text = "Unknown"
-                            try:
-                                role_text_locator = card.locator(sel['officers_page']['officer_role'])
-                                if await role_text_locator.count() > 0:
-                                    role_text = (await role_text_locator.inner_text()).strip()
-                            except Exception:
-                                pass
-                            
+                            role_ps = card.xpath(".//p[contains(., 'Role:')]")
+                            if role_ps:
+                                role_text = role_ps[0].text_content().strip()
+
                             officer_dict = {"name": officer_name, "role": role_text, "status": status_span, "link": officer_href}
-                            
-                            if officer_href:
-                                officer_url = urljoin(company_page.url, officer_href)
-                                officer_detail_page = await context.new_page()
-                                await self._inject_stealth(officer_detail_page)
-                                try:
-                                    # Use polite_goto for officer profile pages
-                                    await utils.polite_goto(officer_detail_page, officer_url, logger=logger, limiter=self.rate_limiter)
-                                    selectors = sel['officer_appointments_page']
-                                    
-                                    async def _get_officer_field(p: Page, selector: str) -> str:
-                                        loc = p.locator(selector)
-                                        return (await loc.inner_text()).strip() if await loc.count() else "Unknown"
-
-                                    dob = await _get_officer_field(officer_detail_page, selectors['officer_dob'])
-                                    nationality = await _get_officer_field(officer_detail_page, selectors['officer_nationality'])
-                                    residence = await _get_officer_field(officer_detail_page, selectors['officer_residence'])
-                                    occupation = await _get_officer_field(officer_detail_page, selectors['officer_occupation'])
-                                    appointed_on = await _get_officer_field(officer_detail_page, selectors['officer_appointment_date'])
-                                    
-                                    officer_dict.update({
-                                        'dob': dob,
-                                        'nationality': nationality,
-                                        'residence': residence,
-                                        'occupation': occupation,
-                                        'appointed_on': appointed_on
-                                    })
-                                    
-                                    # Extract other appointments with better regex
-                                    appts_elements = await officer_detail_page.locator("div.appointments-list > div").all()
-                                    officer_appointments = []
-                                    for appt_el in appts_elements:
-                                        appt_text = await appt_el.inner_text()
-                                        # ### PATCH START ###
-                                        # More flexible regex to handle variations in company number formatting
-                                        company_match = re.search(r'(.+?)\s+\(?(?:Company number:\s*)?([A-Za-z0-9]{2,}\d{6,})\)?\s+Appointed on\s+(.+)', appt_text, re.IGNORECASE)
-                                        # ### PATCH END ###
-                                        if company_match:
-                                            officer_appointments.append({
-                                                'company': company_match.group(1).strip(),
-                                                'company_number': company_match.group(2).strip(),
-                                                'date': company_match.group(3).strip()
-                                            })
-                                        else: 
-                                            # Fallback for less structured text
-                                            parts = appt_text.split('Appointed on ')
-                                            if len(parts) > 1:
-                                                company_info = parts[0].strip()
-                                                fallback_company_match = re.match(r'(.+?)\s+\(?(?:Company number:\s*)?([A-Za-z0-9]{2,}\d{6,})\)?', company_info, re.IGNORECASE)
-                                                if fallback_company_match:
-                                                    officer_appointments.append({
-                                                        'company': fallback_company_match.group(1).strip(),
-                                                        'company_number': fallback_company_match.group(2).strip(),
-                                                        'date': parts[-1].strip()
-                                                    })
-                                                else:
-                                                    officer_appointments.append({'company': company_info, 'date': parts[-1].strip()})
-                                            elif appt_text.strip():
-                                                officer_appointments.append({'company': appt_text.strip(), 'date': 'Unknown'})
-
-
-                                    officer_dict['appointments'] = officer_appointments
-
-                                except Exception as e:
-                                    logger.debug(f"Failed to get officer details for {officer_name} at {officer_url}: {e}")
-                                finally:
-                                    await officer_detail_page.close()
-                                    await asyncio.sleep(random.uniform(1.5, 2.5)) # Polite delay
                             active_officers.append(officer_dict)
+                            if officer_href:
+                                pending.append((officer_dict, urljoin(company_page.url, officer_href)))
                         except Exception as off_err:
                             logger.debug(f"Officer card processing error for {company_url}: {off_err}")
+
+                    if pending:
+                        # Officer detail pages are independent network-bound
+                        # fetches: fan them out under a semaphore so the
+                        # company's wall time is max(officer RTT), not the sum
+                        sem = asyncio.Semaphore(max(1, self.config.officer_concurrency))
+                        await asyncio.gather(
+                            *(self._scrape_officer_detail(context, url, od, sem)
+                              for od, url in pending),
+                            return_exceptions=True,
+                        )
                 else:
                     logger.debug(f"No 'People' tab found or enabled for {name}.")
             except Exception as e:
@@ -597,13 +998,319 @@ class EliteWebScraper:
             return None
         finally:
             await company_page.close()
+            self._ctx_pool.put_nowait(context)
             await asyncio.sleep(random.uniform(0.8, 1.6)) # Polite delay after closing page
 
 
+    async def _scrape_officer_detail(self, context: BrowserContext, officer_url: str,
+                                     officer_dict: Dict[str, Any], sem: asyncio.Semaphore) -> None:
+        """Fetches one officer's appointments page and fills officer_dict in place."""
+        selectors = self.selectors["sources"]["companies_house"]['officer_appointments_page']
+        async with sem:
+            officer_detail_page = await context.new_page()
+            try:
+                # Use polite_goto for officer profile pages
+                await utils.polite_goto(officer_detail_page, officer_url, logger=logger, limiter=self.rate_limiter)
+
+                # One content() snapshot parsed in-process: each locator
+                # count()/inner_text() pair was a separate IPC round-trip to
+                # the browser, five fields plus every appointment card deep
+                soup = BeautifulSoup(await officer_detail_page.content(), "lxml")
+
+                def _field(selector: str) -> str:
+                    el = _css(selector).select_one(soup)
+                    return el.get_text(strip=True) if el is not None else "Unknown"
+
+                officer_dict.update({
+                    'dob': _field(selectors['officer_dob']),
+                    'nationality': _field(selectors['officer_nationality']),
+                    'residence': _field(selectors['officer_residence']),
+                    'occupation': _field(selectors['officer_occupation']),
+                    'appointed_on': _field(selectors['officer_appointment_date'])
+                })
+
+                # Extract other appointments with better regex
+                officer_appointments = []
+                for appt_el in _css("div.appointments-list > div").select(soup):
+                    appt_text = appt_el.get_text("\n", strip=True)
+                    # ### PATCH START ###
+                    # More flexible regex to handle variations in company number formatting
+                    company_match = _APPT_RE.search(appt_text)
+                    # ### PATCH END ###
+                    if company_match:
+                        officer_appointments.append({
+                            'company': company_match.group(1).strip(),
+                            'company_number': company_match.group(2).strip(),
+                            'date': company_match.group(3).strip()
+                        })
+                    else:
+                        # Fallback for less structured text
+                        parts = appt_text.split('Appointed on ')
+                        if len(parts) > 1:
+                            company_info = parts[0].strip()
+                            fallback_company_match = _APPT_COMPANY_RE.match(company_info)
+                            if fallback_company_match:
+                                officer_appointments.append({
+                                    'company': fallback_company_match.group(1).strip(),
+                                    'company_number': fallback_company_match.group(2).strip(),
+                                    'date': parts[-1].strip()
+                                })
+                            else:
+                                officer_appointments.append({'company': company_info, 'date': parts[-1].strip()})
+                        elif appt_text.strip():
+                            officer_appointments.append({'company': appt_text.strip(), 'date': 'Unknown'})
+
+                officer_dict['appointments'] = officer_appointments
+
+            except Exception as e:
+                logger.debug(f"Failed to get officer details for {officer_dict.get('name')} at {officer_url}: {e}")
+            finally:
+                await officer_detail_page.close()
+                await asyncio.sleep(random.uniform(1.5, 2.5)) # Polite delay
+
+
+    # -----------------------------------------------------------------------
+    # Companies House JSON API (used whenever an API key is configured)
+    # -----------------------------------------------------------------------
+    _CH_API_BASE = "https://api.company-information.service.gov.uk"
+
+    async def _ch_api_get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """GET one CH API resource as parsed JSON; None on any failure."""
+        url = f"{self._CH_API_BASE}{path}"
+        try:
+            await self.rate_limiter.wait(url)
+            resp = await self.client.get(url, params=params, auth=(self.config.ch_api_key, ""))
+            if resp.status_code != 200:
+                logger.debug(f"CH API {path} returned {resp.status_code}")
+                return None
+            return resp.json()
+        except httpx.HTTPError as e:
+            logger.debug(f"CH API request failed for {path}: {e}")
+            return None
+
+    @staticmethod
+    def _profile_address(profile: Dict[str, Any]) -> str:
+        addr = profile.get('registered_office_address') or {}
+        return ", ".join(str(v) for v in addr.values() if v)
+
+    def _filter_profiles_batch(self, profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Vectorized status/SIC/geo gate over a batch of profile JSONs.
+
+        One pandas pass replaces the per-record Python gates: the status and
+        address checks become C-level str.contains over whole columns, and the
+        SIC check is a single map against the frozen target set.
+        """
+        if not profiles:
+            return []
+        df = pd.DataFrame({
+            'status': [p.get('company_status') or '' for p in profiles],
+            'sic': [tuple(p.get('sic_codes') or ()) for p in profiles],
+            'address': [self._profile_address(p) for p in profiles],
+        })
+        mask = df['status'].str.lower().str.contains('active', regex=False)
+        if self._target_sic_set:
+            target = self._target_sic_set
+            mask &= df['sic'].map(lambda cs: not target.isdisjoint(cs))
+        if self._target_location_lc:
+            mask &= df['address'].str.lower().str.contains(self._target_location_lc, regex=False)
+        return [p for p, keep in zip(profiles, mask.tolist()) if keep]
+
+    async def _build_lead_from_profile(self, profile: Dict[str, Any]) -> Optional[Lead]:
+        """Build a Lead from a vetted profile JSON, enriching with officers.
+
+        Assumes the status/SIC/geo gates already ran (see
+        _filter_profiles_batch), so only survivors pay for officer fetches.
+        """
+        company_number = profile.get('company_number', 'Unknown')
+        c_status = profile.get('company_status') or ''
+        sic = ", ".join(profile.get('sic_codes') or []) or "Unknown"
+        address = self._profile_address(profile)
+
+        name = profile.get('company_name', 'Unknown')
+        accounts = profile.get('accounts') or {}
+        conf = profile.get('confirmation_statement') or {}
+
+        lead = Lead(
+            company_name=name,
+            website=f"https://find-and-update.company-information.service.gov.uk/company/{company_number}",
+            location=address,
+            source='Companies House',
+            scraped_at=datetime.now(),
+            officers=[]
+        )
+        lead.status = c_status
+        lead.company_type = profile.get('type')
+        inc_date = profile.get('date_of_creation') or ''
+        lead.incorporation_date = inc_date
+        match = _INC_YEAR_RE.search(inc_date)
+        lead.founded_year = match[0] if match else None
+        lead.sic_codes = sic
+        lead.accounts_next = (accounts.get('next_accounts') or {}).get('period_end_on') or accounts.get('next_made_up_to')
+        lead.accounts_last = (accounts.get('last_accounts') or {}).get('made_up_to')
+        lead.confirmation_next = conf.get('next_made_up_to')
+        lead.confirmation_last = conf.get('last_made_up_to')
+
+        officers_doc = await self._ch_api_get(
+            f"/company/{company_number}/officers", params={'items_per_page': 100}
+        )
+        active_officers: List[Dict[str, Any]] = []
+        pending: List[Tuple[Dict[str, Any], str]] = []
+        for item in (officers_doc or {}).get('items', []):
+            if item.get('resigned_on'):
+                continue
+            dob = item.get('date_of_birth') or {}
+            appts_path = ((item.get('links') or {}).get('officer') or {}).get('appointments')
+            officer = {
+                'name': item.get('name', 'Unknown'),
+                'role': item.get('officer_role', 'Unknown'),
+                'status': 'Active',
+                'link': appts_path,
+                'dob': f"{dob.get('month', '')}/{dob.get('year', '')}".strip('/') or 'Unknown',
+                'nationality': item.get('nationality', 'Unknown'),
+                'residence': item.get('country_of_residence', 'Unknown'),
+                'occupation': item.get('occupation', 'Unknown'),
+                'appointed_on': item.get('appointed_on', 'Unknown'),
+                'appointments': [],
+            }
+            active_officers.append(officer)
+            if appts_path:
+                pending.append((officer, appts_path))
+
+        if pending:
+            # Same fan-out shape as the browser path's officer-detail scrape
+            sem = asyncio.Semaphore(max(1, self.config.officer_concurrency))
+
+            async def _fill_appointments(officer: Dict[str, Any], path: str) -> None:
+                async with sem:
+                    doc = await self._ch_api_get(path)
+                officer['appointments'] = [
+                    {
+                        'company': (a.get('appointed_to') or {}).get('company_name', 'Unknown'),
+                        'company_number': (a.get('appointed_to') or {}).get('company_number', ''),
+                        'date': a.get('appointed_on', 'Unknown'),
+                    }
+                    for a in (doc or {}).get('items', [])
+                ]
+
+            await asyncio.gather(
+                *(_fill_appointments(o, p) for o, p in pending),
+                return_exceptions=True,
+            )
+
+        lead.officers = active_officers
+        lead.ideal_customer_profile_match = self._compute_icp_score(sic, address)
+
+        logger.info(f"✓ Fetched via CH API: {lead.company_name} | SIC: {sic} | ICP: {lead.ideal_customer_profile_match}")
+        return lead
+
+    async def _scrape_companies_house_api(self) -> List[Lead]:
+        """Companies House via the official JSON API.
+
+        The service exposes the same search/profile/officers/appointments data
+        as structured JSON, so there is no rendering, stealth priming, consent
+        dialog, or regex scraping of label text — a company costs a couple of
+        ~100ms fetches instead of seconds of browser automation.
+        """
+        leads: List[Lead] = []
+        visited: set = set()
+        width = max(1, self.config.max_workers)
+
+        if self.config.exhaustive_mode:
+            searches = [("/alphabetical-search/companies", letter)
+                        for letter in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ']
+        else:
+            searches = [("/search/companies", q) for q in self._build_target_queries()]
+
+        for path, q in searches:
+            if len(leads) >= self.config.target_count:
+                break
+            # The two endpoints page differently: /search/companies takes
+            # start_index/items_per_page, while /alphabetical-search walks by
+            # ordered key (search_above) and ignores start_index entirely —
+            # feeding it start_index just returns the same page again.
+            alphabetical = path.startswith("/alphabetical-search")
+            params: Dict[str, Any] = {'q': q}
+            if alphabetical:
+                params['size'] = 100
+            else:
+                params['items_per_page'] = 100
+                params['start_index'] = 0
+            while len(leads) < self.config.target_count:
+                doc = await self._ch_api_get(path, params=dict(params))
+                items = (doc or {}).get('items') or []
+                if not items:
+                    break
+
+                numbers = []
+                for item in items:
+                    num = item.get('company_number')
+                    status = (item.get('company_status') or '').lower()
+                    if not num or num in visited:
+                        continue
+                    if status and 'active' not in status:
+                        continue
+                    visited.add(num)
+                    numbers.append(num)
+
+                if not numbers:
+                    # Zero progress: everything on the page was already
+                    # visited or filtered out. Without this guard a repeated
+                    # page (e.g. a paging parameter the endpoint ignores)
+                    # would re-fetch the same items forever.
+                    break
+
+                # Stage 1: cheap profile fetches for the page, in waves
+                profiles: List[Dict[str, Any]] = []
+                for i in range(0, len(numbers), width):
+                    results = await asyncio.gather(
+                        *(self._ch_api_get(f"/company/{n}") for n in numbers[i:i + width]),
+                        return_exceptions=True,
+                    )
+                    profiles.extend(r for r in results if isinstance(r, dict))
+
+                # Stage 2: one vectorized pandas pass gates the whole batch
+                kept = self._filter_profiles_batch(profiles)
+
+                # Stage 3: officer enrichment only for survivors, in waves
+                for i in range(0, len(kept), width):
+                    if len(leads) >= self.config.target_count:
+                        break
+                    results = await asyncio.gather(
+                        *(self._build_lead_from_profile(p) for p in kept[i:i + width]),
+                        return_exceptions=True,
+                    )
+                    for res in results:
+                        if isinstance(res, BaseException):
+                            logger.error(f"CH API company fetch failed: {res}")
+                        elif res and len(leads) < self.config.target_count:
+                            leads.append(res)
+
+                if alphabetical:
+                    # Continue the alphabetical walk from the last item's
+                    # ordered key; a page without one means the walk is done
+                    last_key = (items[-1] or {}).get('ordered_alpha_key_with_id')
+                    if not last_key:
+                        break
+                    params['search_above'] = last_key
+                else:
+                    params['start_index'] += len(items)
+                    total = (doc or {}).get('total_results')
+                    if total is not None and params['start_index'] >= total:
+                        break
+
+        logger.info(f"Companies House API yielded {len(leads)} leads.")
+        return leads
+
     # -----------------------------------------------------------------------
     # Robust & Polite Companies House scraper (targeted)
     # -----------------------------------------------------------------------
     async def scrape_companies_house(self, browser: Browser) -> List[Lead]:
+        # Prefer the JSON API whenever a key is configured; the browser flow
+        # below stays as the keyless fallback
+        if self.config.ch_api_key:
+            logger.info("CH API key configured; using the JSON API instead of browser automation.")
+            return await self._scrape_companies_house_api()
+
         key = "companies_house"
         if key not in self.selectors.get("sources", {}):
             logger.warning("Companies House selectors missing; skipping.")
@@ -613,16 +1320,18 @@ class EliteWebScraper:
         leads: List[Lead] = []
         visited_company_urls = set()
 
-        # Prepare proxy if available (requires Playwright to support it)
-        proxy_dict = None
-        if self.config.use_proxies and self.config.proxy_pool:
-            proxy_dict = {'server': random.choice(self.config.proxy_pool)}
+        # Warm up the shared context pool used for company-profile pages
+        await self._ensure_ctx_pool(browser)
 
-        # New context for isolation and stealth (proxy is passed at context creation)
-        context = await utils.new_context_with_profile(browser, proxy=proxy_dict)
+        # New context for isolation and stealth (proxy is passed at context
+        # creation; seeded with last run's cookies so consent is pre-accepted)
+        context = await utils.new_context_with_profile(
+            browser, proxy=self._proxy_dict(), storage_state=self._storage_state()
+        )
+        await self._prime_context(context)
+        await self._block_heavy_resources(context)
         # Main search page for navigation
         search_page = await context.new_page() # Renamed to search_page for clarity
-        await self._inject_stealth(search_page) 
 
         try:
             logger.info(f"Navigating to Companies House homepage: {sel['start_url']}")
@@ -661,8 +1370,10 @@ class EliteWebScraper:
                     input_sel = sel['navigation'][input_key]
                     await search_page.wait_for_selector(input_sel, timeout=60000)
                     await search_page.fill(input_sel, letter)
-                    await search_page.click(sel['navigation']['search_submit'], timeout=10000) 
-                    await search_page.wait_for_load_state("networkidle", timeout=60000)
+                    await search_page.click(sel['navigation']['search_submit'], timeout=10000)
+                    # No load-state wait here: the search form page has no
+                    # result rows, so the wait_for_selector on result_rows
+                    # below is the real (and sufficient) readiness gate
                     await asyncio.sleep(random.uniform(2.0, 3.5))
 
                     page_num = 1
@@ -676,10 +1387,8 @@ class EliteWebScraper:
                             logger.info(f"No results found on page {page_num} for letter {letter}")
                             break
                         
+                        page_urls: List[str] = []
                         for row in rows:
-                            if len(leads) >= self.config.target_count:
-                                break
-
                             try:
                                 company_link_el = row.locator(sel['search_results_page']['company_link']).first
                                 company_href = await company_link_el.get_attribute('href')
@@ -695,21 +1404,20 @@ class EliteWebScraper:
                                 if company_url in visited_company_urls:
                                     continue
                                 visited_company_urls.add(company_url)
-
-                                # Call the new helper method to scrape the company profile
-                                profile_lead = await self._scrape_single_company_profile(company_url, context)
-                                if profile_lead:
-                                    leads.append(profile_lead)
+                                page_urls.append(company_url)
 
                             except Exception as e:
                                 logger.error(f"Failed to process a row from alphabetical search results: {e}")
 
+                        # Fan the page's profiles out across the context pool
+                        await self._scrape_profiles_batch(page_urls, leads)
+
                         next_link_locator = search_page.locator(sel['search_results_page']['pagination_next_link'])
                         if await next_link_locator.count() == 0 or not await next_link_locator.is_enabled():
                             break
                         
                         await next_link_locator.click()
-                        await search_page.wait_for_load_state("networkidle")
+                        await search_page.wait_for_load_state("domcontentloaded")
                         page_num += 1
                         await asyncio.sleep(random.uniform(2.0, 4.0))
 
@@ -731,46 +1439,42 @@ class EliteWebScraper:
                     # Navigate to search results for this query. Use polite_goto.
                     search_url = urljoin(sel['start_url'], f"search/companies?q={quote_plus(q)}")
                     await utils.polite_goto(search_page, search_url, logger=logger, limiter=self.rate_limiter)
-                    
-                    page_num = 1
-                    # --- Start Pagination Loop for Targeted Search ---
-                    while len(leads) < self.config.target_count: # Continue until global target is met
-                        logger.info(f"Scraping page {page_num} for query '{q}'")
-                        
-                        await search_page.wait_for_load_state("networkidle", timeout=30000)
-                        company_links = await self._collect_company_links_from_search(search_page)
-                        
-                        if not company_links:
-                            logger.info(f"No more company links on page {page_num} for query '{q}'.")
-                            break # No more links, break pagination for this query
-
-                        for company_url in company_links:
-                            if len(leads) >= self.config.target_count:
-                                break # Stop if global target met
-                            if company_url in visited_company_urls:
-                                continue
-                            visited_company_urls.add(company_url)
+                    # polite_goto already awaited domcontentloaded
+                    company_links = await self._collect_company_links_from_search(search_page)
 
-                            # Call the new helper method to scrape the company profile
-                            profile_lead = await self._scrape_single_company_profile(company_url, context)
-                            if profile_lead:
-                                leads.append(profile_lead)
+                    if not company_links:
+                        logger.info(f"No company links found for query '{q}'.")
+                        continue
 
-                        # Check if global target count is met after processing a page of links
-                        if len(leads) >= self.config.target_count:
-                            logger.info(f"Target count {self.config.target_count} reached. Stopping pagination.")
-                            break # Break pagination loop
-                        
-                        # Pagination for query results (using rel='next' as a common CH pattern)
-                        next_link_locator = search_page.locator(sel['search_results_page']['pagination_next_link'])
-                        if await next_link_locator.count() == 0 or not await next_link_locator.is_enabled(timeout=3000): # Reduced timeout for check
-                            logger.info(f"No next pagination link found for query '{q}' on page {page_num}.")
-                            break # No next link or disabled, break pagination for this query
-                        
-                        await next_link_locator.click()
-                        await search_page.wait_for_load_state("networkidle", timeout=60000)
-                        page_num += 1
-                        await asyncio.sleep(random.uniform(2.0, 4.0)) # Polite delay between pages
+                    # CH search accepts ?page=N, so instead of a serial
+                    # click-Next walk, read the paginator depth once and fetch
+                    # the remaining pages concurrently through the context
+                    # pool — only as many as the remaining target plausibly
+                    # needs, assuming page 1's link density holds.
+                    total_pages = await self._detect_search_page_count(search_page)
+                    remaining = self.config.target_count - len(leads)
+                    pages_needed = 1 + -(-max(0, remaining - len(company_links)) // max(1, len(company_links)))
+                    last_page = min(total_pages, pages_needed)
+                    if last_page > 1:
+                        logger.info(f"Fetching pages 2-{last_page} for query '{q}' concurrently...")
+                        page_lists = await asyncio.gather(
+                            *(self._collect_links_from_numbered_page(search_url, p)
+                              for p in range(2, last_page + 1)),
+                            return_exceptions=True,
+                        )
+                        for pl in page_lists:
+                            if isinstance(pl, list):
+                                company_links.extend(pl)
+
+                    page_urls = [u for u in company_links if u not in visited_company_urls]
+                    visited_company_urls.update(page_urls)
+
+                    # Fan the collected profiles out across the context pool
+                    await self._scrape_profiles_batch(page_urls, leads)
+
+                    if len(leads) >= self.config.target_count:
+                        logger.info(f"Target count {self.config.target_count} reached.")
+                        break
 
                     await asyncio.sleep(random.uniform(3.0, 5.0)) # Delay between queries
         except Exception as e:
@@ -795,15 +1499,8 @@ class EliteWebScraper:
             if not u.netloc:
                 return None
             
-            # List of domains that are typically not a company's main website
-            bad_hosts = [
-                "find-and-update.company-information.service.gov.uk",
-                "companieshouse.gov.uk", "linkedin.com", "facebook.com",
-                "twitter.com", "x.com", "instagram.com", "glassdoor.com",
-                "yell.com", "maps.google", "crunchbase.com", "companycheck.co.uk",
-                "opencorporates.com", "companiesintheuk.co.uk", "bing.com", "duckduckgo.com"
-            ]
-            if any(bad in u.netloc for bad in bad_hosts):
+            # Domains that are typically not a company's main website
+            if _is_bad_host(u.netloc):
                 return None
                 
             # Return only scheme and netloc (root domain)
@@ -812,7 +1509,22 @@ class EliteWebScraper:
             return None
 
     async def _guess_website_via_search(self, company_name: str, location_hint: Optional[str] = None) -> Optional[str]:
-        """Use a simple search (Bing -> DuckDuckGo fallback) to guess official website."""
+        """Use a simple search (Bing -> DuckDuckGo fallback) to guess official website.
+
+        Results (including misses) are memoized on disk keyed by
+        (company_name, location_hint), so duplicate companies and warm re-runs
+        issue no outbound search traffic.
+        """
+        cache_key = self._search_cache_key("website", company_name, location_hint)
+        hit, cached = self._search_cache_get(cache_key)
+        if hit:
+            return cached
+
+        result = await self._search_website(company_name, location_hint)
+        self._search_cache_put(cache_key, result)
+        return result
+
+    async def _search_website(self, company_name: str, location_hint: Optional[str] = None) -> Optional[str]:
         queries = []
         # Prioritize queries that are most likely to yield the official website
         if company_name:
@@ -830,83 +1542,64 @@ class EliteWebScraper:
             ("ddg", "https://duckduckgo.com/html/?q={q}", "a.result__a"),
         ]
 
+        # Strict pass first: only accept candidates whose domain contains the
+        # company name. The old loop mixed the loose "first clean candidate"
+        # fallback into the same iteration, so it always returned from the
+        # very first results page and the strict check never saw the later
+        # (query, engine) combinations. The loose winner is remembered from
+        # pages fetched anyway, so falling back costs no extra requests.
+        name_token = company_name.lower().split()[0] if company_name else ""
+        loose_candidate: Optional[str] = None
         for q in queries:
             for name, tmpl, selector in engines:
                 url = tmpl.format(q=quote_plus(q))
                 try:
                     await self.rate_limiter.wait(url) # Respect rate limits
-                    resp = await asyncio.to_thread(
-                        self.session.get, url, allow_redirects=True, timeout=12
-                    )
+                    resp = await self.client.get(url, timeout=12)
                     if resp.status_code != 200:
                         continue
-                        
-                    soup = BeautifulSoup(resp.text, "html.parser")
-                    for a in soup.select(selector):
+
+                    soup = BeautifulSoup(resp.text, "lxml")
+                    for a in _css(selector).select(soup):
                         href = a.get("href")
                         candidate = self._clean_candidate_url(href) if href else None
-                        
+                        if not candidate:
+                            continue
+
                         # Ensure the candidate domain contains part of the company name as a heuristic
-                        if candidate and company_name.lower().split()[0] in candidate.lower():
+                        if name_token and name_token in candidate.lower():
                             logger.info(f"Guessed website for {company_name}: {candidate} (q={q}, engine={name})")
                             return candidate
-                            
-                        # Less strict fallback: just return the first clean candidate
-                        if candidate:
-                             logger.debug(f"Found potential candidate {candidate} for {company_name} (q={q}, engine={name})")
-                             return candidate
+
+                        if loose_candidate is None:
+                            logger.debug(f"Found potential candidate {candidate} for {company_name} (q={q}, engine={name})")
+                            loose_candidate = candidate
 
                 except Exception as e:
                     logger.debug(f"Search error ({name}/{url}): {e}")
-        return None
+
+        # Less strict fallback: the first clean candidate seen anywhere
+        return loose_candidate
 
     def _harvest_contacts_from_html(self, html: str, base_url: str, lead: Lead):
         """Extract phones, emails, and social links from raw HTML."""
-        sel = self.selectors.get("generic_website", {})
-        
-        # --- Phones ---
-        if not getattr(lead, "phone_number", None):
-            for pat in sel.get("phone_patterns", []):
-                for m in re.finditer(pat, html):
-                    try:
-                        # Use phonenumbers library for robust UK number validation and formatting
-                        n = parse(m.group(0), "GB")
-                        if is_valid_number(n):
-                            lead.phone_number = format_number(n, PhoneNumberFormat.INTERNATIONAL)
-                            lead.phone_verified = True
-                            logger.info(f"✓ Phone: {lead.phone_number}")
-                            break
-                    except Exception:
-                        continue
-                if getattr(lead, "phone_number", None):
-                    break
-
-        # --- Emails ---
-        ep = sel.get("email_pattern")
-        if ep and not getattr(lead, "email", None):
-            for m in re.finditer(ep, html):
-                email = m.group(0)
-                # Filter common false positives
-                if any(x in email.lower() for x in ['example.com', '.png', '.jpg', '.svg', '.gif', 'w3.org']):
-                    continue
-                try:
-                    # Use email_validator for basic format check
-                    v = validate_email(email, check_deliverability=False)
-                    lead.email, lead.email_verified = v.email, True
-                    logger.info(f"✓ Email: {lead.email}")
-                    break
-                except EmailNotValidError:
-                    continue
-
-        # --- Socials ---
+        # Single soup parse: the anchor walk already needed for socials also
+        # collects explicit mailto:/tel: links, which usually make the
+        # full-page regex sweeps below unnecessary.
         socials = getattr(lead, "socials", {}) or {}
+        mailto_candidates: List[str] = []
+        tel_candidates: List[str] = []
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, "lxml")
             for a in soup.find_all("a", href=True):
                 href = a["href"]
                 h = href.lower()
+                if h.startswith("mailto:"):
+                    mailto_candidates.append(href[7:].split('?', 1)[0].strip())
+                elif h.startswith("tel:"):
+                    tel_candidates.append(href[4:].strip())
                 # Check for social media links
-                if "linkedin.com/company" in h or "linkedin.com/in" in h:
+                elif "linkedin.com/company" in h or "linkedin.com/in" in h:
                     socials["linkedin"] = href
                 elif "facebook.com" in h and "sharer" not in h: # Exclude share links
                     socials["facebook"] = href
@@ -919,21 +1612,82 @@ class EliteWebScraper:
         if socials:
             lead.socials = socials
 
+        # --- Phones ---
+        if not getattr(lead, "phone_number", None):
+            self._harvest_phone(tel_candidates, html, lead)
+
+        # --- Emails ---
+        if not getattr(lead, "email", None):
+            self._harvest_email(mailto_candidates, html, lead)
+
+    def _harvest_phone(self, tel_candidates: List[str], html: str, lead: Lead) -> None:
+        # Explicit tel: links are the cheapest, most reliable source
+        for cand in tel_candidates:
+            try:
+                n = parse(cand, "GB")
+                if is_valid_number(n):
+                    lead.phone_number = format_number(n, PhoneNumberFormat.INTERNATIONAL)
+                    lead.phone_verified = True
+                    logger.info(f"✓ Phone: {lead.phone_number}")
+                    return
+            except Exception:
+                continue
+        # Gate the regex sweep: a page whose first 4KB has no digit and which
+        # never mentions +44 almost certainly carries no phone number
+        if not any(c.isdigit() for c in html[:4096]) and '+44' not in html:
+            return
+        # PhoneNumberMatcher finds and parses candidates in one specialized
+        # scan, replacing the old regex-list sweep plus a parse() per match
+        try:
+            for m in PhoneNumberMatcher(html, "GB"):
+                if is_valid_number(m.number):
+                    lead.phone_number = format_number(m.number, PhoneNumberFormat.INTERNATIONAL)
+                    lead.phone_verified = True
+                    logger.info(f"✓ Phone: {lead.phone_number}")
+                    return
+        except Exception:
+            pass
+
+    def _harvest_email(self, mailto_candidates: List[str], html: str, lead: Lead) -> None:
+        def _accept(email: str) -> bool:
+            # Filter common false positives
+            if any(x in email.lower() for x in ['example.com', '.png', '.jpg', '.svg', '.gif', 'w3.org']):
+                return False
+            try:
+                # Use email_validator for basic format check
+                v = validate_email(email, check_deliverability=False)
+            except EmailNotValidError:
+                return False
+            lead.email, lead.email_verified = v.email, True
+            logger.info(f"✓ Email: {lead.email}")
+            return True
+
+        # Explicit mailto: links first; only fall back to the full-page regex
+        # sweep when none validate
+        for cand in mailto_candidates:
+            if cand and _accept(cand):
+                return
+        ep = self._email_regex
+        # '@' containment is a memchr scan; skip the full regex pass on
+        # contact-less pages entirely
+        if ep and '@' in html:
+            for m in ep.finditer(html):
+                if _accept(m.group(0)):
+                    return
+
     async def _get_with_robots(self, url: str) -> Optional[str]:
         """Perform a simple HTTP GET request, respecting robots.txt and rate limits."""
         if not url:
             return None
-        if not self._respect_robots_allowed(url):
+        if not await self._respect_robots_allowed(url):
             logger.info(f"robots.txt disallows fetching {url}; skipping.")
             return None
         try:
             await self.rate_limiter.wait(url)
-            resp = await asyncio.to_thread(
-                self.session.get, url, allow_redirects=True, timeout=15
-            )
+            resp = await self.client.get(url)
             resp.raise_for_status() # Raise an exception for bad status codes (4xx or 5xx)
             return resp.text
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.debug(f"HTTP GET failed for {url}: {e}")
             return None
 
@@ -945,7 +1699,14 @@ class EliteWebScraper:
             return []
             
         # Ensure root has no trailing slash before appending path segments
-        urls = list(dict.fromkeys([root.rstrip("/") + p for p in paths]))
+        base = root.rstrip("/")
+        seen = set()
+        urls = []
+        for p in paths:
+            url = base + p
+            if url not in seen:
+                seen.add(url)
+                urls.append(url)
         return urls
 
     async def _enrich_via_http(self, lead: Lead) -> Lead:
@@ -954,32 +1715,46 @@ class EliteWebScraper:
             return lead
         url_logger.info(f"ENRICH: {lead.website}")
 
-        # Iterate through homepage + contact/about pages
-        for u in self._try_paths(lead.website):
-            html = await self._get_with_robots(u)
-            if not html:
+        # Fetch homepage + contact/about pages concurrently: the shared
+        # HTTP/2 client multiplexes them over one connection, so the six
+        # round-trips overlap instead of running back-to-back (per-domain
+        # spacing from the rate limiter still applies inside each fetch).
+        paths = self._try_paths(lead.website)
+        htmls = await asyncio.gather(
+            *(self._get_with_robots(u) for u in paths), return_exceptions=True
+        )
+        for u, html in zip(paths, htmls):
+            if isinstance(html, BaseException) or not html:
                 continue
-            
+
             self._harvest_contacts_from_html(html, u, lead)
-            
+
             # Short-circuit if we have both essential contacts
             if getattr(lead, "email", None) and getattr(lead, "phone_number", None):
                 break
-                
+
         return lead
 
     async def _screenshot_url(self, browser: Browser, url: str, out_path: str) -> Optional[str]:
         """Captures a full-page screenshot of a URL using Playwright."""
         try:
             # New context for isolation, using a randomized user agent
-            context = await browser.new_context(user_agent=utils.choose_user_agent(), locale="en-GB")
+            context = await browser.new_context(
+                user_agent=utils.choose_user_agent(), locale="en-GB",
+                storage_state=self._storage_state(),
+            )
+            await self._prime_context(context)
             page = await context.new_page()
-            await self._inject_stealth(page)
             
-            await page.goto(url, wait_until="networkidle", timeout=30000)
+            # "load" is enough for a pixel-stable DOM; "networkidle" could
+            # stall for the full timeout on sites with chatty tracking pixels
+            await page.goto(url, wait_until="load", timeout=30000)
             
             os.makedirs(os.path.dirname(out_path), exist_ok=True)
-            await page.screenshot(path=out_path, full_page=True)
+            # Viewport-only JPEG: the shot is evidence the site is real, not
+            # an archive. full_page rendered the whole scroll height into
+            # multi-MB PNGs and cost seconds of paint/encode per site.
+            await page.screenshot(path=out_path, full_page=False, type="jpeg", quality=70)
             
             await page.close()
             await context.close()
@@ -1009,10 +1784,24 @@ class EliteWebScraper:
         return officers[0].get("name") if officers else None
 
     async def _maybe_find_ceo_linkedin(self, company_name: str, ceo_name: str) -> Optional[str]:
-        """Best-effort guess for CEO's LinkedIn profile via search."""
+        """Best-effort guess for CEO's LinkedIn profile via search.
+
+        Memoized on disk like _guess_website_via_search, keyed by
+        (company_name, ceo_name).
+        """
         if not company_name or not ceo_name:
             return None
-            
+
+        cache_key = self._search_cache_key("ceo_linkedin", company_name, ceo_name)
+        hit, cached = self._search_cache_get(cache_key)
+        if hit:
+            return cached
+
+        result = await self._search_ceo_linkedin(company_name, ceo_name)
+        self._search_cache_put(cache_key, result)
+        return result
+
+    async def _search_ceo_linkedin(self, company_name: str, ceo_name: str) -> Optional[str]:
         # Targeted search queries for LinkedIn profiles
         queries = [
             f'site:linkedin.com/in "{ceo_name}" "{company_name}"',
@@ -1025,12 +1814,12 @@ class EliteWebScraper:
             url = f"https://www.bing.com/search?q={quote_plus(q)}"
             try:
                 await self.rate_limiter.wait(url)
-                resp = await asyncio.to_thread(self.session.get, url, timeout=10)
+                resp = await self.client.get(url, timeout=10)
                 html = resp.text
-                soup = BeautifulSoup(html, "html.parser")
+                soup = BeautifulSoup(html, "lxml")
                 
                 # Bing selector for result links
-                for a in soup.select("li.b_algo h2 a"):
+                for a in _css("li.b_algo h2 a").select(soup):
                     href = a.get("href", "")
                     if "linkedin.com/in/" in href:
                         logger.debug(f"Found CEO LinkedIn for {ceo_name}: {href}")
@@ -1045,13 +1834,22 @@ class EliteWebScraper:
     async def enrich_lead_data(self, lead: Lead) -> Lead:
         """Asynchronous enrichment step."""
         logger.debug(f"Starting enrichment for: {lead.company_name}")
-        
+
+        # Apply the target-SIC filter up front: a lead that will be dropped
+        # anyway shouldn't cost a website guess plus the contact-page GETs.
+        # _score_leads re-checks the same condition, so the late filter still
+        # catches anything that slips through.
+        if self.config.sic_codes and not self._sic_matches_target(lead.sic_codes or ""):
+            logger.debug(f"Early filter: Skipping enrichment for {lead.company_name} (non-target SIC: {lead.sic_codes})")
+            lead.data_quality_score = -1
+            return lead
+
         # --- 1. Website Discovery ---
         ch_domains = [
             "find-and-update.company-information.service.gov.uk",
             "companieshouse.gov.uk"
         ]
-        website_host = urlparse(lead.website or "").netloc.lower() if lead.website else ""
+        website_host = _netloc(lead.website) if lead.website else ""
         # If no website, or it's a Companies House URL, try to guess the real website
         if not lead.website or any(h in website_host for h in ch_domains):
             guessed = await self._guess_website_via_search(lead.company_name, lead.location)
@@ -1075,40 +1873,65 @@ class EliteWebScraper:
         except Exception as e:
             logger.warning(f"Error during CEO/LinkedIn inference for {lead.company_name}: {e}")
 
-        # --- 4. Final ICP/Quality Score Computation ---
-        
-        # Compute ICP if not already done (mainly for Clutch leads)
-        if not getattr(lead, "ideal_customer_profile_match", None):
-            sic = getattr(lead, "sic_codes", "") or ""
-            addr = getattr(lead, "location", "") or ""
-            lead.ideal_customer_profile_match = self._compute_icp_score(sic, addr)
-        
-        # Additional ICP boosts
-        officers = getattr(lead, "officers", [])
-        if any(o.get('role', '').lower() in ['director', 'ceo', 'managing director'] for o in officers):
-            # Boost if a senior officer is present, indicating high data value
-            lead.ideal_customer_profile_match = min(1.0, lead.ideal_customer_profile_match + 0.20)
-        
-        # Pain points based on SIC (simple heuristic)
-        sic_codes = lead.sic_codes.split(', ') if lead.sic_codes else []
-        if "73110" in sic_codes: # Advertising agencies
-            lead.pain_points = ["Lead generation efficiency", "Attribution/ROI visibility", "Scaling paid media profitably"]
-        elif "62012" in sic_codes: # Business & domestic software development
-            lead.pain_points = ["Technical debt management", "Scalability issues", "Talent acquisition challenges"]
-        
-        # Filter: If SIC codes are set in config, only keep leads that match
-        if self.config.sic_codes:
-            if not self._sic_matches_target(lead.sic_codes or ""):
-                logger.debug(f"Final filter: Removing {lead.company_name} due to non-target SIC: {lead.sic_codes}")
-                # Return a special Lead indicating it should be filtered out
-                lead.data_quality_score = -1 # Set a very low score for easy filtering in the main loop
-                return lead
-        
-        # Calculate final quality score
-        lead.calculate_quality_score()
-        
+        # ICP/pain-point/quality scoring is intentionally NOT done here any
+        # more: it is pure CPU work, so run_scraper batches it for the whole
+        # enriched set in _score_leads once all I/O tasks have finished.
         return lead
 
+    # Batches below this size aren't worth a worker round-trip (submission
+    # pickles the rows both ways and may have to spawn the pool first);
+    # score them inline on the event loop instead.
+    _CPU_BATCH_MIN = 32
+
+    async def _score_leads(self, leads: List[Lead]) -> None:
+        """Phase-2 CPU pass: ICP score, pain points, quality score, SIC filter.
+
+        The async enrichment phase leaves leads I/O-complete; this extracts
+        each lead's scoring inputs into plain tuples and runs the whole batch
+        through _score_batch, split across a ProcessPoolExecutor (one slice
+        per core) so the Python-level scoring loop never blocks the event
+        loop. Leads failing the target-SIC filter come back with
+        data_quality_score = -1 for the caller to drop.
+        """
+        if not leads:
+            return
+        rows = [
+            (
+                lead.ideal_customer_profile_match,
+                lead.sic_codes or "",
+                lead.location or "",
+                tuple(o.get('role', '').lower() for o in (lead.officers or [])),
+                tuple(bool(getattr(lead, attr)) for attr, _ in _QUALITY_WEIGHTS),
+            )
+            for lead in leads
+        ]
+        if len(rows) < self._CPU_BATCH_MIN:
+            results = _score_batch(rows, self._target_sic_set, self._target_location_lc)
+        else:
+            if self._cpu_pool is None:
+                self._cpu_pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=os.cpu_count()
+                )
+            loop = asyncio.get_running_loop()
+            step = -(-len(rows) // max(1, os.cpu_count() or 1))  # ceil division
+            parts = await asyncio.gather(*(
+                loop.run_in_executor(
+                    self._cpu_pool, _score_batch, rows[i:i + step],
+                    self._target_sic_set, self._target_location_lc,
+                )
+                for i in range(0, len(rows), step)
+            ))
+            results = [r for part in parts for r in part]
+        for lead, (icp, pain_points, quality, keep) in zip(leads, results):
+            lead.ideal_customer_profile_match = icp
+            if pain_points:
+                lead.pain_points = pain_points
+            if self.config.sic_codes and not keep:
+                logger.debug(f"Final filter: Removing {lead.company_name} due to non-target SIC: {lead.sic_codes}")
+                lead.data_quality_score = -1  # Very low score for easy filtering in the main loop
+            else:
+                lead.data_quality_score = quality
+
     # -----------------------------------------------------------------------
     # Orchestration
     # -----------------------------------------------------------------------
@@ -1125,7 +1948,7 @@ class EliteWebScraper:
             if not l.website:
                 continue
             # Skip Companies House and common social media links, as these are not the company's main website.
-            if any(h in urlparse(l.website).netloc for h in ["find-and-update.company-information.service.gov.uk", "companieshouse.gov.uk", "linkedin.com", "facebook.com", "twitter.com", "x.com", "instagram.com"]):
+            if any(h in _netloc(l.website) for h in ["find-and-update.company-information.service.gov.uk", "companieshouse.gov.uk", "linkedin.com", "facebook.com", "twitter.com", "x.com", "instagram.com"]):
                 continue
             # Only screenshot if we are missing essential contact info
             if not getattr(l, "email", None) or not getattr(l, "phone_number", None):
@@ -1138,13 +1961,20 @@ class EliteWebScraper:
         async with async_playwright() as p:
             # Launch browser once for all screenshots
             browser = await p.chromium.launch(headless=True)
+            # Bound in-flight captures: each one opens its own context (the
+            # required isolation), the semaphore just caps renderer load
+            sem = asyncio.Semaphore(4)
+
+            async def shoot(url: str, out: str) -> Optional[str]:
+                async with sem:
+                    return await self._screenshot_url(browser, url, out)
+
             tasks = []
-            
             for l in to_shoot:
-                fn = self._safe_filename(l.company_name) + ".png"
+                fn = self._safe_filename(l.company_name) + ".jpg"
                 out = os.path.join("screenshots", fn)
-                tasks.append(self._screenshot_url(browser, l.website, out))
-                
+                tasks.append(shoot(l.website, out))
+
             # Run all screenshots concurrently
             results = await asyncio.gather(*tasks, return_exceptions=True)
             
@@ -1161,7 +1991,7 @@ class EliteWebScraper:
     def _safe_filename(self, name: str) -> str:
         """Converts a company name into a filesystem-safe filename."""
         # Replace non-alphanumeric/non-dot/non-hyphen with underscore
-        n = re.sub(r"[^a-zA-Z0-9._-]+", "_", name.strip())
+        n = _SAFE_FILENAME_RE.sub("_", name.strip())
         # Trim to a reasonable length
         n = n[:120] 
         # Fallback if name is empty after cleaning
@@ -1173,14 +2003,28 @@ class EliteWebScraper:
         logger.info("🚀 Starting PROOF BOT Elite Web Scraper")
         logger.info("=" * 60)
 
+        # Refresh the target-SIC and location snapshots: apply_smart_selection()
+        # runs after the scraper is constructed and may have rebound
+        # config.sic_codes/config.target_location, and filtering against the
+        # stale values would discard every lead the new queries produce.
+        self.target_sic_codes = self.config.sic_codes
+        self._target_sic_set = frozenset(self.target_sic_codes or [])
+        self._target_location_lc = (self.config.target_location or "").strip().lower()
+
         all_leads: List[Lead] = []
         
         # Use a single playwright instance for async scraping phases
         async with async_playwright() as p:
             # Configure browser launch (e.g., headless, proxy options could go here)
             browser = await p.chromium.launch(headless=True)
-            # Context for non-CH sources (like Clutch)
-            context = await browser.new_context(user_agent=utils.choose_user_agent(), locale="en-GB")
+            # Context for non-CH sources (like Clutch), warm-started from
+            # the previous run's cookies when available
+            context = await browser.new_context(
+                user_agent=utils.choose_user_agent(), locale="en-GB",
+                storage_state=self._storage_state(),
+            )
+            await self._prime_context(context)
+            await self._block_heavy_resources(context)
             sources = self.selectors.get("sources", {})
 
             # --- Run Companies House scraper (targeted/exhaustive) ---
@@ -1196,7 +2040,6 @@ class EliteWebScraper:
                 # Need a new page/context setup for concurrent execution if necessary, 
                 # but Clutch is simpler, using the general context is fine.
                 page = await context.new_page()
-                await self._inject_stealth(page)
                 tasks.append(self.scrape_clutch(page))
                 logger.info("📄 Prepared Clutch scrape task.")
 
@@ -1210,6 +2053,7 @@ class EliteWebScraper:
                         all_leads.extend(r)
 
             await context.close()
+            await self._close_ctx_pool()
             await browser.close()
             logger.info("✓ Browser closed.")
 
@@ -1219,35 +2063,61 @@ class EliteWebScraper:
             return []
 
         logger.info(f"📊 Total raw leads from all sources: {len(all_leads)}")
-        seen, unique_leads = set(), []
-        for lead in all_leads:
-            key = (lead.company_name or "").strip().lower()
-            if key and key not in seen:
-                unique_leads.append(lead)
-                seen.add(key)
+        # First-seen-wins dedup via one insertion-ordered dict. Keys are the
+        # 64-bit hash of the Lead's cached lowercased name, not the string
+        # itself: the table stores ints instead of keeping every name alive,
+        # and the name is hashed exactly once per lead (SipHash randomization
+        # is per-process, which is all a within-run dedup needs; collisions
+        # on a few thousand names are vanishingly unlikely).
+        keyed = [(h, lead) for lead in all_leads
+                 if (k := lead.name_lower.strip()) and (h := hash(k)) is not None]
+        # dict.fromkeys over a sized list is the one construction CPython
+        # pre-sizes (_PyDict_NewPresized), so the table never rehash-grows
+        # during the fill below; duplicate keys collapse to their first slot.
+        seen_map: Dict[int, Optional[Lead]] = dict.fromkeys([h for h, _ in keyed])
+        for h, lead in keyed:
+            if seen_map[h] is None:
+                seen_map[h] = lead
+        unique_leads = [l for l in seen_map.values() if l is not None]
         logger.info(f"🧬 Found {len(unique_leads)} unique leads after deduplication.")
 
         # --- Enrichment (now fully asynchronous) ---
         logger.info(f"✨ Enriching {len(unique_leads)} leads with async tasks.")
         enriched_leads = []
         
-        enrich_tasks = [self.enrich_lead_data(lead) for lead in unique_leads]
+        # Bound the fan-out: one coroutine per lead all at once would
+        # oversubscribe the HTTP pool and the search-engine rate limiter
+        # with hundreds of parked tasks each holding buffers
+        enrich_sem = asyncio.Semaphore(max(1, self.config.enrich_concurrency))
+
+        async def _bounded_enrich(l: Lead) -> Lead:
+            async with enrich_sem:
+                return await self.enrich_lead_data(l)
+
+        enrich_tasks = [_bounded_enrich(lead) for lead in unique_leads]
         results = await asyncio.gather(*enrich_tasks, return_exceptions=True)
 
         for result in results:
             if isinstance(result, Exception):
                 logger.error(f"An enrichment task failed: {result}", exc_info=True)
-            # Filter out leads that failed the final SIC check in enrichment
-            elif result and getattr(result, "data_quality_score", 0) >= 0:
+            elif result:
                 enriched_leads.append(result)
 
+        # Phase 2: one batched CPU pass (ICP, pain points, quality, SIC
+        # filter) over everything the I/O phase produced
+        await self._score_leads(enriched_leads)
+        enriched_leads = [l for l in enriched_leads if l.data_quality_score >= 0]
+
         logger.info(f"✅ Enrichment completed. {len(enriched_leads)} leads remain after final filtering.")
 
         # --- Optional screenshots for missing data (Async again) ---
         await self._capture_missing_screenshots_async(enriched_leads)
 
         # --- Final Sort and Output ---
-        enriched_leads.sort(key=lambda x: x.data_quality_score, reverse=True)
+        # Full sort is required: main.py reports leads[0] as the top lead and
+        # exports in score order. attrgetter keeps the key extraction in C
+        # instead of dispatching a Python lambda per element.
+        enriched_leads.sort(key=attrgetter('data_quality_score'), reverse=True)
         
         if enriched_leads:
             logger.info("🏆 Top 5 leads by quality score:")
@@ -1258,4 +2128,7 @@ class EliteWebScraper:
 
         logger.info(f"🏁 Scraper run finished. Returning {len(enriched_leads)} processed leads.")
         logger.info("=" * 60)
+        for h in url_logger.handlers:
+            h.flush()
+        await self.aclose()
         return enriched_leads
\ No newline at end of file
@@ -16,9 +16,12 @@ import logging
 import os
 import random
 import re
-from collections import defaultdict, Counter
+from collections import Counter
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
+import numpy as np
+
 from playwright.async_api import Page, async_playwright, TimeoutError as PlaywrightTimeoutError
 from typing import TypedDict
 from datetime import datetime
@@ -36,7 +39,7 @@ class Config:
     RECOMMENDED_SIC_FILE: str = 'recommended_sic_selectors.json'
     REPORT_FILE: str = 'sic_colossus_report.md'
     LOG_FILE: str = 'logs/sic_colossus.log'
-    SAMPLE_URLS: List[str] = [  # From log; cap 20 for speed
+    SAMPLE_URLS: Tuple[str, ...] = (  # From log; cap 20 for speed
         "https://find-and-update.company-information.service.gov.uk/company/13681460",
         "https://find-and-update.company-information.service.gov.uk/company/12399628",
         "https://find-and-update.company-information.service.gov.uk/company/12618177",
@@ -57,14 +60,14 @@ class Config:
         "https://find-and-update.company-information.service.gov.uk/company/12864125",
         "https://find-and-update.company-information.service.gov.uk/company/12868662",
         "https://find-and-update.company-information.service.gov.uk/company/12326634",
-    ]
+    )
     CONCURRENT_TASKS: int = 3
     PAGE_TIMEOUT: int = 30000
     ANALYSIS_TIMEOUT: int = 10000
-    USER_AGENTS: List[str] = [
+    USER_AGENTS: Tuple[str, ...] = (
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-    ]
+    )
     SIC_HINTS: Dict[str, List[str]] = {  # Expandable for other sites
         'sic_section': ['SIC', 'Nature of business', 'business (SIC)', 'SIC code'],
         'sic_code': [r'\d{5}', '73110', '62012', '62090', '63110', '63120', '70229']
@@ -83,6 +86,7 @@ class DiscoveredElement(TypedDict):
     isVisible: bool
     depth: int
     extracted_code: str
+    count: int
 
 class AnalysisData(TypedDict):
     selector: str
@@ -145,9 +149,13 @@ JS_ANALYZER_CODE = """
         const sel = generateSelector(el);
         if (sel && !found.has(sel)) {
           const code = extractCode(text);
+          // Count matches here, in-page: one querySelectorAll beats a
+          // locator.count() CDP round trip per candidate from Python
+          let count = 0;
+          try { count = document.querySelectorAll(sel).length; } catch (e) {}
           results[cat].push({
             selector: sel, innerText: text, isVisible: isVisible(el),
-            depth: getDepth(el), extracted_code: code
+            depth: getDepth(el), extracted_code: code, count: count
           });
           found.add(sel);
         }
@@ -157,6 +165,11 @@ JS_ANALYZER_CODE = """
   return results;
 }
 """
+# Precompiled scoring patterns: score_selector runs per candidate per URL,
+# and module-level patterns skip re's internal cache lookup on every call
+_CLASSES_RE = re.compile(r'\.([a-zA-Z0-9_-]+)')
+_FIVE_DIGIT_RE = re.compile(r'\d{5}')
+
 # Logger (diagnostic-style: per-URL progress)
 def setup_logging() -> logging.Logger:
     os.makedirs('logs', exist_ok=True)
@@ -170,30 +183,40 @@ def setup_logging() -> logging.Logger:
 
 logger = setup_logging()
 
-# Core (scoring same; added extraction counter)
-def score_selector(selector: str, data: DiscoveredElement, hints: List[str]) -> Tuple[int, str]:
+# Core (scoring same; added extraction counter). The cached form keys on the
+# hashable unpacking of (selector, data, hints): the same selectors recur
+# across every audited URL and generate_report re-scores the current selector,
+# so ranking does O(unique selectors) scoring work instead of O(candidates).
+@lru_cache(maxsize=4096)
+def _score_selector_cached(selector: str, extracted_code: str, is_visible: bool,
+                           depth: int, hints: Tuple[str, ...]) -> Tuple[int, str]:
     score = 0
     weights = Config.SCORE_WEIGHTS
     if '#' in selector: score += weights['id']
     if '[data-testid' in selector: score += weights['data-testid']
-    classes = re.findall(r'\.([a-zA-Z0-9_-]+)', selector)
+    classes = _CLASSES_RE.findall(selector)
     if len(classes) == 1 and any(h in classes[0].lower() for h in hints): score += weights['unique_class']
     if len(selector) > 25: score += (len(selector) - 25) * weights['length']
     if ':nth-child' in selector: score += weights['nth_child']
-    if re.search(r'\d{5}', data['extracted_code']): score += weights['sic_regex_match']
-    if data['isVisible']: score += weights['visibility']
-    depth = data['depth']
+    if _FIVE_DIGIT_RE.search(extracted_code): score += weights['sic_regex_match']
+    if is_visible: score += weights['visibility']
     if depth <= 3: score += weights['low_depth'] * (4 - depth)
-    if not data['isVisible']: score += weights['invisibility']
+    if not is_visible: score += weights['invisibility']
     tier = 'Gold' if score >= 150 else 'Silver' if score >= 80 else 'Bronze'
     return score, tier
 
+def score_selector(selector: str, data: DiscoveredElement, hints: List[str]) -> Tuple[int, str]:
+    """Dict/list-friendly wrapper over the memoized scoring core."""
+    return _score_selector_cached(selector, data['extracted_code'],
+                                  bool(data['isVisible']), data['depth'], tuple(hints))
+
 # Analyze URL (added progress log, error catch, extraction count)
 async def analyze_url(page: Page, url: str, hints: Dict[str, List[str]], job_id: int, total: int) -> Tuple[str, Dict[str, List[DiscoveredElement]], int]:
     extractions = 0
     try:
         await page.goto(url, timeout=Config.PAGE_TIMEOUT, wait_until='domcontentloaded')
-        await page.wait_for_load_state('networkidle')
+        # No networkidle wait: the SIC section is server-rendered, so the
+        # selector wait below is the real gate and fires at DOMContentLoaded
         await page.wait_for_selector('h2:has-text("Nature of business")', timeout=5000)  # Ensure SIC section renders
 
         # Pre-scan
@@ -208,9 +231,10 @@ async def analyze_url(page: Page, url: str, hints: Dict[str, List[str]], job_id:
             for el in elems[:10]:
                 full_sel = el['selector']  # Drop ::text; we have innerText from JS
                 sc, tier = score_selector(full_sel, el, hints.get(cat, []))
-                # Use .count() instead of .all() for element count (avoids text parsing/escaping)
-                count = await page.locator(full_sel).count()
-                scored[cat].append({'selector': full_sel, 'score': sc, 'tier': tier, 'count': count, 'data': el})
+                # Match count comes back from the JS analyzer itself; the old
+                # page.locator(sel).count() here cost a CDP round trip per candidate
+                scored[cat].append({'selector': full_sel, 'score': sc, 'tier': tier,
+                                    'count': el.get('count', 0), 'data': el})
                 if el['extracted_code']: extractions += 1
         logger.info(f"Job {job_id}/{total}: {url} - Found {sum(len(v) for v in scored.values())} candidates ({extractions} codes extracted)")
         return url, scored, extractions
@@ -222,6 +246,8 @@ async def analyze_url(page: Page, url: str, hints: Dict[str, List[str]], job_id:
 def generate_report(stats: RunStats, current_selector: str, ranked: List[AnalysisData]) -> str:
     # FIX: Handle case where current_selector is a list to prevent TypeError
     current_str = current_selector[0] if isinstance(current_selector, list) else current_selector
+    # Score the current selector once; it was previously called twice inline
+    cur_score, cur_tier = score_selector(current_str, {'extracted_code': '', 'isVisible': True, 'depth': 5}, ['SIC'])
     lines = [
         f"# SIC Colossus Report - {stats['start_time'].strftime('%Y-%m-%d %H:%M')}",
         "---",
@@ -238,19 +264,19 @@ def generate_report(stats: RunStats, current_selector: str, ranked: List[Analysi
         "| Selector | Score | Tier | Extraction Rate |",
         "|:---|:---|:---|:---|",
         # FIX: Use current_str in f-string to prevent TypeError
-        f"| `{current_str}` | {score_selector(current_str, {'extracted_code': '', 'isVisible': True, 'depth': 5}, ['SIC'])[0]} | {score_selector(current_str, {'extracted_code': '', 'isVisible': True, 'depth': 5}, ['SIC'])[1]} | N/A |",
+        f"| `{current_str}` | {cur_score} | {cur_tier} | N/A |",
     ]
     for rec in ranked[:5]:
         lines.append(f"| `{rec['selector']}` | {rec['score']} | {rec['tier']} | {rec['extraction_rate']:.1%} |")
     lines.append("\n**Verdict**: " + ("🚀 Upgrade to Gold selector for 2x extraction rate." if stats['gold_recommendations'] > 0 else "⚠️ No Gold found; manual inspect sample pages."))
     return "\n".join(lines)
 
-# Auto-Fuse (like fuse_selectors.py: clean/prioritize top 3 into array)
-def auto_fuse(ranked: List[AnalysisData]):
+# Auto-Fuse (like fuse_selectors.py: clean/prioritize top 3 into array).
+# Takes the selectors dict main() already parsed instead of re-reading and
+# re-parsing the file it loaded moments earlier.
+def auto_fuse(selectors: Dict[str, Any], ranked: List[AnalysisData]):
     if not ranked: return
     top_3 = [r['selector'] for r in ranked[:3]]
-    with open(Config.CURRENT_SELECTORS_FILE, 'r') as f:
-        selectors = json.load(f)
     selectors['sources']['companies_house']['company_overview_page']['nature_of_business_sic'] = top_3
     with open(Config.CURRENT_SELECTORS_FILE, 'w') as f:
         json.dump(selectors, f, indent=2)
@@ -272,26 +298,72 @@ async def main():
         browser = await p.chromium.launch(headless=True)
         context = await browser.new_context(user_agent=random.choice(Config.USER_AGENTS))
 
+        # Audit only reads DOM text: abort images/fonts/media/CSS so every
+        # sampled page reaches DOMContentLoaded (the gating wait) sooner
+        blocked = {'image', 'media', 'font', 'stylesheet'}
+
+        async def _route(route):
+            if route.request.resource_type in blocked:
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route('**/*', _route)
+
+        # Context-level stealth: one add_init_script covers every page the
+        # workers open, instead of a per-page stealth_async CDP call + JS
+        # compile per sampled URL (same pattern as the scraper's contexts)
+        stealth_js = None
+        try:
+            with open(os.path.join(os.path.dirname(__file__), 'stealth.js'), 'r') as f:
+                stealth_js = f.read()
+        except Exception as e:
+            logger.warning(f"Could not load stealth.js: {e}")
+        if stealth_js:
+            await context.add_init_script(stealth_js)
+
         semaphore = asyncio.Semaphore(Config.CONCURRENT_TASKS)
-        tasks = []
-        for i, url in enumerate(Config.SAMPLE_URLS):
-            async def worker(url=url, i=i):  # Closure for per-task
-                async with semaphore:
-                    page = await context.new_page()
-                    if STEALTH_AVAILABLE:
-                        await stealth_async(page)
-                    try:
-                        return await analyze_url(page, url, Config.SIC_HINTS, i+1, len(Config.SAMPLE_URLS))
-                    finally:
-                        await page.close()
-            tasks.append(worker())
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        async def run_one(url: str, i: int):
+            async with semaphore:
+                page = await context.new_page()
+                # Fall back to per-page stealth only if the shared
+                # context-level script could not be loaded
+                if stealth_js is None and STEALTH_AVAILABLE:
+                    await stealth_async(page)
+                try:
+                    return await analyze_url(page, url, Config.SIC_HINTS, i, len(Config.SAMPLE_URLS))
+                except Exception as e:
+                    # Isolate failures here so one bad URL can't cancel the group
+                    logger.error(f"Job {i}: {url} crashed - {e}")
+                    return url, None, 0
+                finally:
+                    await page.close()
+
+        # One shared coroutine under a TaskGroup replaces the per-URL
+        # closure + gather(return_exceptions=True) dance, with structured
+        # cancellation if something truly unexpected escapes
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(run_one(url, i + 1))
+                     for i, url in enumerate(Config.SAMPLE_URLS)]
+        results = [t.result() for t in tasks]
         await browser.close()
 
-    # Aggregate (with counters)
-    all_data: Dict[str, List[Dict]] = defaultdict(list)
+    # Aggregate: one pass over the task results fills SoA-style parallel
+    # accumulators indexed by a selector->int map, so the ranking math below
+    # runs vectorized over numpy arrays instead of per-bucket Python sums
     failed = []
     extraction_counter = Counter()
+    # Prevalence = on how many URLs a selector appeared. A Counter updated
+    # with each URL's unique-selector set replaces the per-bucket URL sets,
+    # which stored every URL string just to take a cardinality at the end
+    prevalence: Counter = Counter()
+    sel_to_idx: Dict[str, int] = {}
+    idx_to_sel: List[str] = []
+    score_sums: List[float] = []
+    count_sums: List[float] = []
+    occurrences: List[int] = []
+    extraction_hits: List[int] = []
     for res in results:
         if isinstance(res, Exception):
             logger.error(f"Task failed: {res}")
@@ -301,50 +373,54 @@ async def main():
         if data is None:
             failed.append(url)
             continue
-        for cat, cands in data.items():
-            for c in cands:
-                c['url'] = url  # Track originating page
-            all_data[cat].extend(cands)
+        cands = data.get('sic_code', [])  # Rank focuses on 'sic_code'
+        for cand in cands:
+            idx = sel_to_idx.get(cand['selector'])
+            if idx is None:
+                idx = sel_to_idx[cand['selector']] = len(idx_to_sel)
+                idx_to_sel.append(cand['selector'])
+                score_sums.append(0.0)
+                count_sums.append(0.0)
+                occurrences.append(0)
+                extraction_hits.append(0)
+            score_sums[idx] += cand['score']
+            count_sums[idx] += cand['count']
+            occurrences[idx] += 1
+            if cand['data']['extracted_code']: extraction_hits[idx] += 1
+        prevalence.update({c['selector'] for c in cands})
         stats['total_extractions'] += exts
         extraction_counter[url] = exts
 
     stats['urls_success'] = len(Config.SAMPLE_URLS) - len(failed)
     stats['urls_fail'] = len(failed)
 
-    # Rank (focus 'sic_code')
+    # Rank: all per-selector averages, prevalence bonuses and extraction
+    # rates computed in one vectorized pass, then emitted in argsort order
+    # (which replaces the separate ranked.sort afterwards)
     ranked: List[AnalysisData] = []
-    code_data = defaultdict(lambda: {'scores': [], 'counts': [], 'pages': set(), 'extractions': 0, 'total_pages': 0})
-    for cand in all_data['sic_code']:
-        sel = cand['selector']
-        bucket = code_data[sel]
-        bucket['scores'].append(cand['score'])
-        bucket['counts'].append(cand['count'])
-        bucket['pages'].add(cand['url'])
-        if cand['data']['extracted_code']: bucket['extractions'] += 1
-
-    for sel, bucket in code_data.items():
-        if not bucket['scores']: continue
-        bucket['total_pages'] = len(bucket['pages']) or 1  # Unique pages, avoid div/0
-        avg_score = sum(bucket['scores']) / len(bucket['scores'])
-        prevalence = len(bucket['pages'])
-        final_score = avg_score + (prevalence * Config.SCORE_WEIGHTS['prevalence'])
-        ext_rate = bucket['extractions'] / bucket['total_pages']
-        _, tier = score_selector(sel, {'extracted_code': '73110', 'isVisible': True, 'depth': 3}, ['SIC'])
-        ranked.append({
-            'selector': sel, 'score': int(final_score), 'tier': tier,
-            'avg_count': sum(bucket['counts'])/len(bucket['counts']),
-            'prevalence': f"{prevalence}/{stats['urls_success']}",
-            'extraction_rate': ext_rate
-        })
-        if tier == 'Gold': stats['gold_recommendations'] += 1
-
-    ranked.sort(key=lambda x: x['score'], reverse=True)
+    if idx_to_sel:
+        occ = np.array(occurrences, dtype=np.float64)
+        pages_seen = np.array([prevalence[s] for s in idx_to_sel], dtype=np.float64)
+        avg_scores = np.array(score_sums) / occ
+        final_scores = avg_scores + pages_seen * Config.SCORE_WEIGHTS['prevalence']
+        avg_counts = np.array(count_sums) / occ
+        ext_rates = np.array(extraction_hits) / np.maximum(pages_seen, 1.0)  # Avoid div/0
+        for i in np.argsort(-final_scores):
+            sel = idx_to_sel[i]
+            _, tier = score_selector(sel, {'extracted_code': '73110', 'isVisible': True, 'depth': 3}, ['SIC'])
+            ranked.append({
+                'selector': sel, 'score': int(final_scores[i]), 'tier': tier,
+                'avg_count': float(avg_counts[i]),
+                'prevalence': f"{int(pages_seen[i])}/{stats['urls_success']}",
+                'extraction_rate': float(ext_rates[i])
+            })
+            if tier == 'Gold': stats['gold_recommendations'] += 1
 
     # Outputs
     rec_json = {'nature_of_business_sic': {'type': 'css', 'value': [r['selector'] for r in ranked]}}
     with open(Config.RECOMMENDED_SIC_FILE, 'w') as f:
         json.dump(rec_json, f, indent=2)
-    auto_fuse(ranked)
+    auto_fuse(selectors, ranked)
     stats['end_time'] = datetime.now()
     stats['total_duration'] = (stats['end_time'] - stats['start_time']).total_seconds()
     report = generate_report(stats, current_sic, ranked)
@@ -9,7 +9,9 @@ import asyncio
 import random
 import re
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
@@ -34,7 +36,9 @@ __all__ = [
 ]
 
 # --- User Agents (expanded, deduped, realistic mix) ---
-USER_AGENTS = [
+# Tuple: immutable module constant, safe from accidental mutation and
+# hashable should a cached helper ever take it as an argument
+USER_AGENTS = (
     # Chrome desktop (Win/Mac/Linux)
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36",
@@ -42,7 +46,7 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_6) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_6) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.5 Safari/605.1.15",
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
-]
+)
 
 class _NullLogger:
     def debug(self, *args, **kwargs): pass
@@ -57,10 +61,11 @@ async def human_delay(min_ms: int = 80, max_ms: int = 220) -> None:
     await asyncio.sleep(random.uniform(min_ms, max_ms) / 1000.0)
 
 def choose_user_agent(seed: Optional[Union[int, str]] = None) -> str:
-    rng = random.Random()
-    if seed is not None:
-        rng.seed(seed)
-    return rng.choice(USER_AGENTS)
+    # Unseeded (the common path) uses the module RNG; constructing a fresh
+    # random.Random() per call paid a full Mersenne Twister init each time.
+    if seed is None:
+        return random.choice(USER_AGENTS)
+    return random.Random(seed).choice(USER_AGENTS)
 
 @dataclass
 class SessionProfile:
@@ -80,35 +85,40 @@ async def new_context_with_profile(browser: Browser, profile: Optional[SessionPr
     ctx = await browser.new_context(**context_args)
     return ctx
 
+@lru_cache(maxsize=4096)
+def _domain_of(url: str) -> str:
+    """Cached netloc extraction: the limiter sees the same URLs (and hosts'
+    repeated pages) thousands of times, and urlparse is a Python-level
+    parser costing ~µs per call versus a dict hit."""
+    return urlparse(url).netloc or ""
+
+
 class DomainRateLimiter:
+    # Cap on tracked domains: beyond this the least-recently-used entry is
+    # evicted, so a long-lived run across many sites keeps bounded state.
+    _MAX_DOMAINS = 1024
+
     def __init__(self, min_delay_s: float = 1.8):
         self.min_delay = float(min_delay_s)
-        self._last_at: Dict[str, float] = {}
-        self._locks: Dict[str, asyncio.Lock] = {}
+        # domain -> [lock, last_at], ordered by recency for LRU eviction.
+        # (The old separate acquire()/release() pair is gone: it had no
+        # callers, and a caller that forgot release() left the domain's
+        # lock held forever.)
+        self._domains: "OrderedDict[str, list]" = OrderedDict()
 
     def _domain(self, url: str) -> str:
-        return urlparse(url).netloc or ""
-
-    async def acquire(self, url: str):
-        domain = self._domain(url)
-        if domain not in self._locks:
-            self._locks[domain] = asyncio.Lock()
-        
-        lock = self._locks[domain]
-        await lock.acquire()
-        
-        now = time.monotonic()
-        last = self._last_at.get(domain, 0.0)
-        gap = now - last
-        wait_s = max(0.0, self.min_delay - gap)
-        if wait_s > 0:
-            await asyncio.sleep(wait_s)
-            
-    def release(self, url: str):
-        domain = self._domain(url)
-        self._last_at[domain] = time.monotonic()
-        if domain in self._locks:
-            self._locks[domain].release()
+        return _domain_of(url)
+
+    def _entry(self, domain: str) -> list:
+        entry = self._domains.get(domain)
+        if entry is None:
+            entry = [asyncio.Lock(), 0.0]
+            self._domains[domain] = entry
+            while len(self._domains) > self._MAX_DOMAINS:
+                self._domains.popitem(last=False)
+        else:
+            self._domains.move_to_end(domain)
+        return entry
 
     # PATCH: Modified `wait` method to correctly handle rate-limiting.
     async def wait(self, url: Optional[str] = None):
@@ -121,16 +131,12 @@ class DomainRateLimiter:
             await asyncio.sleep(self.min_delay)
             return
 
-        domain = self._domain(url)
-        
-        # Ensure a lock exists for this domain
-        if domain not in self._locks:
-            self._locks[domain] = asyncio.Lock()
+        entry = self._entry(self._domain(url))
 
         # Use an async context manager for the lock to ensure it's released properly
-        async with self._locks[domain]:
+        async with entry[0]:
             now = time.monotonic()
-            last_activity_time = self._last_at.get(domain, 0.0) 
+            last_activity_time = entry[1]
 
             # Calculate how much more time needs to pass before `min_delay` is met
             elapsed_since_last = now - last_activity_time
@@ -138,10 +144,10 @@ class DomainRateLimiter:
 
             if time_to_wait > 0:
                 await asyncio.sleep(time_to_wait)
-            
-            # Update `_last_at` to the current time, marking that a request *is now being initiated*.
+
+            # Update last_at to the current time, marking that a request *is now being initiated*.
             # This ensures the next request to the same domain factors in this one's start time.
-            self._last_at[domain] = time.monotonic() 
+            entry[1] = time.monotonic()
             # The lock is implicitly released when exiting the 'async with' block.
 
 
@@ -191,14 +197,15 @@ async def ensure_consent(page: Page, logger: Optional[Any] = None) -> bool:
     return await handle_consent(page, logger=logger)
 
 def _flatten_selectors(entries: Sequence[Union[str, Dict[str, Any]]]) -> List[str]:
-    flat = []
-    for s in entries:
-        if isinstance(s, dict):
-            if s.get('type', 'css') == 'css' and s.get('value'):
-                flat.append(s['value'])
-        elif isinstance(s, str) and s.strip():
-            flat.append(s)
-    return flat
+    # One comprehension, dispatching on exact type: selector entries are
+    # plain dicts/strs from JSON, so `type(s) is ...` skips isinstance's
+    # subclass walk on this per-lookup hot path while preserving order.
+    return [
+        s['value'] if type(s) is dict else s
+        for s in entries
+        if (type(s) is dict and s.get('type', 'css') == 'css' and s.get('value'))
+        or (type(s) is str and s.strip())
+    ]
 
 async def wait_for_any(page: Page, selectors_dict: Dict, keys: List[str], timeout: int = 30000) -> bool:
     selectors = []
@@ -0,0 +1,42 @@
+# scripts/compile_selectors.py
+"""Precompile the selector JSON files into proof_bot/_compiled_selectors.py.
+
+Run at build/deploy time (see Dockerfile). The generated module holds the
+selector dicts as Python literals, so startup serves them from the cached
+.pyc instead of re-parsing JSON on every run. The loaders in config.py and
+scraper.py fall back to the JSON files when the module is absent.
+"""
+import json
+import os
+import pprint
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUT_PATH = os.path.join(REPO_ROOT, 'proof_bot', '_compiled_selectors.py')
+
+# Keyed by filename so loaders can look up whatever config points at
+SOURCE_FILES = (
+    'selectors.json',
+    'fullselectors.json',
+    'recommended_sic_selectors.json',
+)
+
+
+def main():
+    compiled = {}
+    for name in SOURCE_FILES:
+        path = os.path.join(REPO_ROOT, name)
+        if not os.path.exists(path):
+            print(f"Skipping {name} (not found)")
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            compiled[name] = json.load(f)
+        print(f"Compiled {name}")
+
+    with open(OUT_PATH, 'w', encoding='utf-8') as f:
+        f.write('# Generated by scripts/compile_selectors.py - do not edit by hand.\n')
+        f.write('SELECTORS = ' + pprint.pformat(compiled, sort_dicts=False) + '\n')
+    print(f"Wrote {OUT_PATH}")
+
+
+if __name__ == '__main__':
+    main()